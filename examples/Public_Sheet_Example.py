@@ -1,21 +1,55 @@
 import streamlit as st
 
-st.subheader("📗 Google Sheets st.connection using Public URLs")
+from streamlit_gsheets import GSheetsConnection
 
 url = "https://docs.google.com/spreadsheets/d/1JDy9md2VZPz4JbYtRPJLs81_3jUK47nx6GYQjgU8qNY/edit?usp=sharing"
 
-st.write("#### 1. Read public Google Worksheet as Pandas")
+# Snippets are displayed with st.code and executed by the functions below them,
+# which is cheaper on each rerun than st.echo re-reading the script source.
+READ_SNIPPET = """
+import streamlit as st
+
+from streamlit_gsheets import GSheetsConnection
 
-with st.echo():
-    import streamlit as st
+conn = st.connection("gsheets", type=GSheetsConnection)
 
-    from streamlit_gsheets import GSheetsConnection
+df = conn.read(spreadsheet=url, usecols=[0, 1])
+st.dataframe(df)
+"""
 
+
+def read_public_worksheet():
     conn = st.connection("gsheets", type=GSheetsConnection)
 
     df = conn.read(spreadsheet=url, usecols=[0, 1])
     st.dataframe(df)
 
+
+QUERY_SNIPPET = """
+import streamlit as st
+
+from streamlit_gsheets import GSheetsConnection
+
+conn = st.connection("gsheets", type=GSheetsConnection)
+
+df = conn.query('select births from "Example 2" limit 10', spreadsheet=url)
+st.dataframe(df)
+"""
+
+
+def query_public_worksheet():
+    conn = st.connection("gsheets", type=GSheetsConnection)
+
+    df = conn.query('select births from "Example 2" limit 10', spreadsheet=url)
+    st.dataframe(df)
+
+
+st.subheader("📗 Google Sheets st.connection using Public URLs")
+
+st.write("#### 1. Read public Google Worksheet as Pandas")
+st.code(READ_SNIPPET, language="python")
+read_public_worksheet()
+
 st.write("#### 2. Query public Google Worksheet using SQL")
 st.info(
     "Mutation SQL queries are in-memory only and do not results in the Worksheet update.",
@@ -27,14 +61,5 @@ st.warning(
         The worksheet, which you query is defined by GID query parameter or GID parameters to query method.""",
     icon="⚠️",
 )
-
-
-with st.echo():
-    import streamlit as st
-
-    from streamlit_gsheets import GSheetsConnection
-
-    conn = st.connection("gsheets", type=GSheetsConnection)
-
-    df = conn.query('select births from "Example 2" limit 10', spreadsheet=url)
-    st.dataframe(df)
+st.code(QUERY_SNIPPET, language="python")
+query_public_worksheet()
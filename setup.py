@@ -8,11 +8,14 @@ NAME = "st-gsheets-connection"
 
 INSTALL_REQUIRES = [
     "streamlit>=1.32.0",
-    "gspread>=5.8.0, <6",
+    "gspread>=5.9.0, <6",
     "gspread-pandas>=3.2.2",
     "gspread-dataframe>=3.3.0",
     "gspread-formatting>=1.1.2",
-    "duckdb>=0.8.1",
+    "duckdb>=0.10.0",
+    "pandas>=2.0.0",
+    "pyarrow>=14",
+    "requests>=2.27",
     "sql-metadata>=2.7.0",
     "validators>=0.22.0",
 ]
@@ -13,30 +13,644 @@
 # limitations under the License.
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import timedelta
-from typing import List, Optional, Union, cast
-from urllib.parse import parse_qs, urlparse
-
-import duckdb
-from gspread import service_account_from_dict
-from gspread.client import Client as GSpreadClient
-from gspread.client import SpreadsheetNotFound
-from gspread.spreadsheet import Spreadsheet
-from gspread.worksheet import Worksheet
-from gspread_dataframe import get_as_dataframe, set_with_dataframe
-from gspread_formatting.dataframe import (
-    format_with_dataframe as set_format_with_dataframe,
-)
-from numpy import ndarray
-from pandas import DataFrame, read_csv
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, ContextManager, Dict, Iterator, List, Optional, Tuple, Union, cast
+from urllib.parse import quote
+
+from numpy import dtype as np_dtype
+from numpy import frombuffer, integer, nan, ndarray, uint8
+from pandas import ArrowDtype, DataFrame, MultiIndex, StringDtype, concat, isna, read_csv, read_parquet
+from pandas.api.types import pandas_dtype
+from pandas.io.parsers import TextParser
+from requests import Session
 from sql_metadata import Parser
 from streamlit.connections import ExperimentalBaseConnection
 from streamlit.dataframe_util import convert_anything_to_pandas_df, is_dataframe_like
-from streamlit.runtime.caching import cache_data
+from streamlit.runtime.caching import cache_resource
+from streamlit.runtime.caching.cache_utils import CachedFunc
 from validators.url import url as validate_url
 
+# gspread (with google-auth) is imported where service account client uses it,
+# apps reading only public spreadsheets don't pay for its import
+if TYPE_CHECKING:
+    import duckdb
+    from gspread.client import Client as GSpreadClient
+    from gspread.spreadsheet import Spreadsheet
+    from gspread.worksheet import Worksheet
+    from pyarrow import ChunkedArray, RecordBatchReader
+
+
+# spreadsheet key and worksheet gid of a spreadsheet URL in a single pass,
+# a gid in the fragment (#gid=...) takes precedence over the query string (?gid=...)
+_URL_RE = re.compile(
+    r"/d/(?P<key>[^/]+)/[^?#]*"
+    r"(?:\?(?:[^#]*?&)??gid=(?P<query_gid>[^&#]+))?[^#]*"
+    r"(?:#.*?gid=(?P<fragment_gid>\w+))?"
+)
+_CSV_EXPORT_URL = "https://docs.google.com/spreadsheet/ccc?key={key}&output=csv"
+
+_PARQUET_CACHE_DIR = Path.home() / ".cache" / "streamlit-gsheets"
+
+
+def _parquet_cache_path(key: tuple, version: str = "") -> Path:
+    """Returns path of persisted DataFrame for given key, version (e.g.
+    spreadsheet modification time) is a suffix, so stale files are easy to find."""
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    version_digest = hashlib.sha1(version.encode()).hexdigest()[:16]
+    return _PARQUET_CACHE_DIR / f"{digest}-{version_digest}.parquet"
+
+
+def _load_parquet_cache(path: Path, ttl: Optional[Union[int, timedelta, None]] = None) -> Optional[DataFrame]:
+    """Returns DataFrame persisted at path, or None if it's missing or older than ttl."""
+    try:
+        modified = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if ttl is not None:
+        max_age = ttl.total_seconds() if isinstance(ttl, timedelta) else ttl
+        if time.time() - modified > max_age:
+            return None
+    # file is memory mapped by pyarrow, its pages are decompressed without copying it into a buffer first
+    return read_parquet(path, memory_map=True)
+
+
+def _save_parquet_cache(path: Path, df: DataFrame) -> None:
+    """Persists DataFrame at path, replacing other versions of the same key."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # written to temporary file first, other processes may read the cache at the same time
+    temporary_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        df.to_parquet(temporary_path, compression="zstd")
+    except (ValueError, TypeError):
+        # columns with mixed types cannot be stored as parquet, such worksheet is not persisted
+        temporary_path.unlink(missing_ok=True)
+        return
+    os.replace(temporary_path, path)
+    digest = path.name.split("-")[0]
+    for stale_path in path.parent.glob(f"{digest}-*.parquet"):
+        if stale_path != path:
+            stale_path.unlink(missing_ok=True)
+
+
+# seconds to connect to Google and between received bytes, stalled download fails instead of blocking the app
+_HTTP_TIMEOUT = 30.0
+
+
+@cache_resource(show_spinner=False)
+def _http_session() -> Session:
+    """Returns HTTP session shared by all public spreadsheet reads, its pooled keep-alive
+    connections to Google outlive script reruns, so TLS handshake is not repeated per read."""
+    return Session()
+
+
+# CSV exports of public worksheets by url, with ETag and Last-Modified validators of the response,
+# time of its download and time when it expires; least recently downloaded exports are dropped first
+# beyond the entries and bytes limits
+_CSV_EXPORTS: Dict[str, Tuple[Optional[str], Optional[str], float, Optional[float], bytes]] = {}
+_CSV_EXPORTS_LOCK = threading.Lock()
+_CSV_EXPORTS_MAX_ENTRIES = 128
+_CSV_EXPORTS_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _ttl_seconds(ttl: Optional[Union[int, timedelta, None]]) -> Optional[float]:
+    return ttl.total_seconds() if isinstance(ttl, timedelta) else ttl
+
+
+def _fetch_csv(url: str, max_age: Optional[float] = 0) -> bytes:
+    """Downloads CSV export of public worksheet. Export downloaded less than max_age seconds
+    ago (None for any age) is returned without a request, so reads with other parser options
+    and queries of the same worksheet share one download. Older export is requested with
+    If-None-Match / If-Modified-Since headers, so unchanged worksheet is answered with
+    304 Not Modified without body and previously downloaded content is returned."""
+    with _CSV_EXPORTS_LOCK:
+        _evict_csv_exports()
+        cached = _CSV_EXPORTS.get(url)
+    headers = {}
+    if cached is not None:
+        etag, last_modified, downloaded, _, content = cached
+        if max_age is None or time.time() - downloaded < max_age:
+            return content
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    with _http_session().get(url, headers=headers, timeout=_HTTP_TIMEOUT, stream=True) as response:
+        if response.status_code == 304 and cached is not None:
+            content = cached[4]
+        else:
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            # body is read in 1 MiB chunks, response.content reads 10 KiB ones, which is several times slower
+            content = b"".join(response.iter_content(chunk_size=1 << 20))
+    downloaded = time.time()
+    # stale export is kept for one more max_age, as the body of a 304 Not Modified answer to revalidation
+    expires = None if max_age is None else downloaded + 2 * max_age
+    with _CSV_EXPORTS_LOCK:
+        _CSV_EXPORTS.pop(url, None)
+        _CSV_EXPORTS[url] = (etag, last_modified, downloaded, expires, content)
+        _evict_csv_exports()
+    return content
+
+
+def _evict_csv_exports() -> None:
+    """Drops expired CSV exports, then least recently downloaded ones beyond entries and bytes
+    limits. Must be called with _CSV_EXPORTS_LOCK held."""
+    now = time.time()
+    for url in [url for url, cached in _CSV_EXPORTS.items() if cached[3] is not None and cached[3] <= now]:
+        del _CSV_EXPORTS[url]
+    total_bytes = sum(len(cached[4]) for cached in _CSV_EXPORTS.values())
+    while len(_CSV_EXPORTS) > _CSV_EXPORTS_MAX_ENTRIES or total_bytes > _CSV_EXPORTS_MAX_BYTES:
+        total_bytes -= len(_CSV_EXPORTS.pop(next(iter(_CSV_EXPORTS)))[4])
+
+
+# default na_values of pandas read_csv, so PyArrow parser recognizes the same missing values
+_CSV_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+# integers beyond int64, which read_csv parses as unsigned or Python integers
+_BIG_INT_PATTERN = r"^\s*-?[0-9]{19}"
+
+
+def _has_arrow_number_mismatch(content: bytes) -> bool:
+    """Returns True if CSV contains numbers, which PyArrow infers differently from read_csv:
+    with plus sign (floats for PyArrow) or hexadecimal (integers for PyArrow)."""
+    if b"+" in content:
+        return True
+    # substring search for frequent "0" is slow, "0x" and "0X" prefixes are found by numpy
+    data = frombuffer(content, dtype=uint8)
+    return bool((((data[1:] | 0x20) == ord("x")) & (data[:-1] == ord("0"))).any())
+
+
+def _differs_from_read_csv(column: ChunkedArray) -> bool:
+    """Returns True if read_csv would parse column differently: booleans with missing values
+    are objects with NaN for read_csv, integers beyond int64 are unsigned or Python integers."""
+    from pyarrow import compute, types  # noqa: PLC0415
+
+    if types.is_boolean(column.type):
+        return column.null_count > 0
+    if types.is_floating(column.type):
+        return (compute.max(compute.abs(column)).as_py() or 0) >= 2**63
+    if types.is_string(column.type):
+        longest = compute.max(compute.utf8_length(column)).as_py() or 0
+        return longest >= 19 and compute.any(compute.match_substring_regex(column, _BIG_INT_PATTERN)).as_py()
+    return False
+
+
+def _arrow_column_types(dtype: Optional[dict]) -> Optional[dict]:
+    """Translates read_csv dtype option into PyArrow column types, or returns None if some
+    dtype is not one of numpy booleans, integers, floats or str."""
+    from pyarrow import from_numpy_dtype, string  # noqa: PLC0415
+
+    column_types = {}
+    for name, column_dtype in (dtype or {}).items():
+        resolved = pandas_dtype(column_dtype)
+        if isinstance(resolved, StringDtype) and resolved == pandas_dtype(str):
+            column_types[name] = string()
+        elif isinstance(resolved, np_dtype) and resolved.kind in "OU":
+            # object, or str before pandas 3, read_csv keeps the values as Python strings
+            column_types[name] = string()
+        elif isinstance(resolved, np_dtype) and resolved.kind in "biuf":
+            column_types[name] = from_numpy_dtype(resolved)
+        else:
+            return None
+    return column_types
+
+
+def _read_csv_dtype(column_dtype) -> object:
+    """Returns dtype of column, which read_csv parses with given dtype option."""
+    resolved = pandas_dtype(column_dtype)
+    return np_dtype(object) if isinstance(resolved, np_dtype) and resolved.kind == "U" else resolved
+
+
+def _read_csv_arrow(
+    content: bytes,
+    usecols: Optional[Union[List[int], List[str]]] = None,
+    dtype: Optional[dict] = None,
+    dtype_backend: Optional[str] = None,
+) -> Optional[DataFrame]:
+    """Parses CSV export with multithreaded PyArrow CSV reader, several times faster than pandas
+    read_csv, into the same DataFrame as read_csv would return. Columns with dtype are converted
+    straight to it, without type inference. With "pyarrow" dtype_backend PyArrow columns are
+    wrapped in ArrowDtype without conversion to numpy. Returns None for exports, which PyArrow would
+    parse differently (duplicate or blank column names, no rows, booleans with missing values, some
+    number formats) or cannot parse at all, those are left to read_csv."""
+    arrow_backed = dtype_backend == "pyarrow"
+    if dtype_backend not in (None, "pyarrow") or (arrow_backed and dtype is not None):
+        return None
+    if _has_arrow_number_mismatch(content):
+        return None
+    if dtype is not None and not (isinstance(dtype, dict) and all(isinstance(name, str) for name in dtype)):
+        return None
+    column_types = _arrow_column_types(dtype)
+    if column_types is None:
+        return None
+    from pyarrow import ArrowException, BufferReader, Table, float64, string, types  # noqa: PLC0415
+    from pyarrow.csv import ConvertOptions  # noqa: PLC0415
+    from pyarrow.csv import read_csv as read_arrow_csv  # noqa: PLC0415
+
+    def parse(column_types: dict, include_columns: Optional[List[str]] = None) -> Table:
+        convert_options = ConvertOptions(
+            column_types=column_types,
+            include_columns=include_columns or [],
+            null_values=_CSV_NULL_VALUES,
+            strings_can_be_null=True,
+            true_values=["True", "TRUE", "true"],
+            false_values=["False", "FALSE", "false"],
+        )
+        return read_arrow_csv(BufferReader(content), convert_options=convert_options)
+
+    try:
+        table = parse(column_types)
+        names = table.column_names
+        if len(set(names)) != len(names) or "" in names or table.num_rows == 0:
+            return None
+        if usecols is not None:
+            # like read_csv, selected columns are kept in order of the export
+            if all(type(column) is int for column in usecols):
+                table = table.select(sorted(set(cast(List[int], usecols))))
+            elif all(isinstance(column, str) and column in names for column in usecols):
+                table = table.select([name for name in names if name in usecols])
+            else:
+                return None
+        # read_csv does not infer dates and times, their columns are parsed again as strings
+        temporal = {field.name: string() for field in table.schema if types.is_temporal(field.type)}
+        if temporal:
+            strings = parse(temporal, list(temporal))
+            for name in temporal:
+                position = table.column_names.index(name)
+                table = table.set_column(position, name, strings.column(name))
+        for position, field in enumerate(table.schema):
+            column = table.column(position)
+            if arrow_backed:
+                # in ArrowDtype missing values of any type are nulls, like in PyArrow
+                if not types.is_boolean(field.type) and _differs_from_read_csv(column):
+                    return None
+            elif types.is_null(field.type):
+                # read_csv parses columns without any value as floats
+                table = table.set_column(position, field.name, column.cast(float64()))
+            elif field.name not in column_types and _differs_from_read_csv(column):
+                return None
+    except (ArrowException, IndexError):
+        return None
+    if arrow_backed:
+        return table.to_pandas(types_mapper=ArrowDtype)
+    df = table.to_pandas()
+    for position, field in enumerate(table.schema):
+        column_dtype = pandas_dtype((dtype or {})[field.name]) if field.name in column_types else None
+        if isinstance(column_dtype, np_dtype) and column_dtype.kind in "OU":
+            df[field.name] = df[field.name].astype(object)
+        if types.is_string(field.type) and table.column(position).null_count > 0 and df[field.name].dtype == object:
+            # missing strings of object columns are None, read_csv gives NaN
+            df[field.name] = df[field.name].where(df[field.name].notna(), nan)
+    # e.g. integers with missing values become floats, read_csv raises for them
+    if any(name in df.columns and df[name].dtype != _read_csv_dtype((dtype or {})[name]) for name in column_types):
+        return None
+    return df
+
+
+def _parse_csv(content: bytes, **options) -> DataFrame:
+    """Parses CSV export into DataFrame, export without parser options other than usecols,
+    dtype and dtype_backend is parsed by PyArrow. With chunksize or iterator option read_csv returns a reader, which
+    cannot be cached and handed out to every caller, its chunks are concatenated."""
+    if options.keys() <= {"usecols", "dtype", "dtype_backend"}:
+        df = _read_csv_arrow(content, options.get("usecols"), options.get("dtype"), options.get("dtype_backend"))
+        if df is not None:
+            return df
+    parsed = read_csv(BytesIO(content), **options)
+    if isinstance(parsed, DataFrame):
+        return parsed
+    with parsed as reader:
+        return concat(reader, ignore_index=True)
+
+
+@cache_resource(show_spinner=False)
+def _service_account_client(secrets_dict: dict) -> GSpreadClient:
+    """Returns authenticated gspread client, shared by all connections using the same credentials."""
+    from gspread import service_account_from_dict  # noqa: PLC0415
+
+    return service_account_from_dict(secrets_dict)
+
+
+def _cell_value(value):
+    """Converts DataFrame cell into JSON serializable Sheets API value. Like set_with_dataframe
+    does, strings starting with ' are escaped by another one, which USER_ENTERED input drops."""
+    if isna(value) is True:
+        return ""
+    if isinstance(value, (bool, int, float)):
+        return value
+    if not isinstance(value, str):
+        value = str(value)
+    return f"'{value}" if value.startswith("'") else value
+
+
+def _to_dataframe(data) -> Optional[DataFrame]:
+    """Returns data to write as DataFrame, or None if there is no data. DataFrames are used as they
+    are, without dispatch through Streamlit dataframe converters and their defensive copies."""
+    if isinstance(data, DataFrame):
+        return data
+    if isinstance(data, ndarray) and data.dtype.names is not None:
+        return DataFrame.from_records(data)
+    if isinstance(data, ndarray) and data.ndim == 2:
+        return DataFrame(data)
+    if isinstance(data, list):
+        return DataFrame(data) if data else None
+    if is_dataframe_like(data):
+        return convert_anything_to_pandas_df(data)
+    return None
+
+
+def _dataframe_to_values(data: DataFrame) -> List[list]:
+    """Converts DataFrame into Sheets API values, column header included, a row for each level
+    of MultiIndex columns like set_with_dataframe writes it."""
+    cells = data.to_numpy("object", copy=True)
+    cells[isna(cells)] = ""
+    # bool, int and float columns already hold JSON serializable values, only other columns are converted cell by cell
+    for position, dtype in enumerate(data.dtypes):
+        if dtype.kind not in "biuf":
+            cells[:, position] = [_cell_value(value) for value in cells[:, position]]
+    values = [
+        [_cell_value(label) for label in data.columns.get_level_values(level)] for level in range(data.columns.nlevels)
+    ]
+    values.extend(cells.tolist())
+    return values
+
+
+def _options_key(value) -> object:
+    """Returns hashable, deterministic cache key of parser options. Streamlit cannot hash e.g.
+    pandas extension dtypes or dicts of converter functions, and repr of a function differs
+    on every rerun, so functions are identified by their name and code. Cached functions take
+    options themselves as ``_options`` argument, which Streamlit leaves out of hashing."""
+    if isinstance(value, dict):
+        return tuple(sorted((repr(key), _options_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_options_key(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(item) for item in value))
+    code = getattr(value, "__code__", None)
+    if code is not None:
+        return (value.__module__, value.__qualname__, code.co_code, repr(code.co_consts))
+    return repr(value)
+
+
+# sizes of DataFrames cached by reads and queries with max_cache_mb, per cached function in order
+# of caching: hashed arguments, all arguments, size in bytes and time of caching
+_CACHED_SIZES: Dict[str, Dict[tuple, Tuple[tuple, int, float]]] = {}
+_CACHED_SIZES_LOCK = threading.Lock()
+
+
+def _bound_cache_size(
+    name: str,
+    cached: CachedFunc,
+    args: tuple,
+    df: DataFrame,
+    *,  # keyword-only arguments:
+    max_cache_mb: Optional[float],
+    ttl: Optional[Union[int, timedelta, None]],
+    max_entries: Optional[int],
+    extra_bytes: int = 0,
+) -> DataFrame:
+    """Keeps DataFrames cached by cached function within max_cache_mb, called with args of the cached
+    function (the last one is its unhashed _options) and DataFrame it's about to cache. Oldest cached
+    DataFrames are cleared from the cache, the budget is not translated into max_entries: Streamlit
+    recreates cache of function, whose max_entries changed. Extra bytes are memory kept along with
+    the DataFrame, e.g. downloaded CSV export it was parsed from."""
+    if max_cache_mb is None:
+        return df
+    size = int(df.memory_usage(deep=True).sum()) + extra_bytes
+    max_age = _ttl_seconds(ttl)
+    now = time.time()
+    evicted = []
+    with _CACHED_SIZES_LOCK:
+        sizes = _CACHED_SIZES.setdefault(name, {})
+        # entries expired after ttl or dropped beyond max_entries are no longer cached by Streamlit
+        for key, (_, _, cached_at) in list(sizes.items()):
+            if max_age is not None and cached_at + max_age <= now:
+                del sizes[key]
+        sizes.pop(args[:-1], None)
+        while max_entries is not None and len(sizes) >= max_entries > 0:
+            del sizes[next(iter(sizes))]
+        sizes[args[:-1]] = (args, size, now)
+        total = sum(entry[1] for entry in sizes.values())
+        while len(sizes) > 1 and total > max_cache_mb * 1024 * 1024:
+            entry = sizes.pop(next(iter(sizes)))
+            total -= entry[1]
+            evicted.append(entry[0])
+    for evicted_args in evicted:
+        try:
+            cached.clear(*evicted_args)
+        except TypeError:
+            # Streamlit without clearing of single entries, the whole cache of function is cleared
+            cached.clear()
+            with _CACHED_SIZES_LOCK:
+                _CACHED_SIZES[name] = {args[:-1]: (args, size, now)}
+            break
+    return df
+
+
+def _value_render_params(evaluate_formulas: bool) -> dict:
+    return {
+        "valueRenderOption": "UNFORMATTED_VALUE" if evaluate_formulas else "FORMULA",
+        "dateTimeRenderOption": "FORMATTED_STRING",
+    }
+
+
+def _response_json(response) -> dict:
+    """Decodes JSON body of Google API response, with orjson if it's installed: values of large
+    worksheets decode about a third faster than with json module used by requests."""
+    try:
+        import orjson  # noqa: PLC0415
+    except ImportError:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _values_get(spreadsheet: Spreadsheet, range_name: str, params: dict) -> dict:
+    """Same request as Spreadsheet.values_get, response is decoded by _response_json."""
+    from gspread.urls import SPREADSHEET_VALUES_URL  # noqa: PLC0415
+
+    url = SPREADSHEET_VALUES_URL % (spreadsheet.id, quote(range_name))
+    return _response_json(spreadsheet.client.request("get", url, params=params))
+
+
+def _values_batch_get(spreadsheet: Spreadsheet, ranges: List[str], params: dict) -> dict:
+    """Same request as Spreadsheet.values_batch_get, response is decoded by _response_json."""
+    from gspread.urls import SPREADSHEET_VALUES_BATCH_URL  # noqa: PLC0415
+
+    url = SPREADSHEET_VALUES_BATCH_URL % spreadsheet.id
+    return _response_json(spreadsheet.client.request("get", url, params={**params, "ranges": ranges}))
+
+
+@lru_cache(maxsize=256)
+def _parse_sql(sql: str) -> Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]:
+    """Returns table names used in SQL query and names of columns used anywhere in it, from
+    single parse memoized since apps run the same queries on every rerun. Columns are None if
+    query may use all columns of its tables (e.g. SELECT *, COUNT(*)) or uses none of them by name."""
+    parser = Parser(sql)
+    tables = tuple(parser.tables)
+    try:
+        columns = None if "*" in parser.tokens or not parser.columns else tuple(parser.columns)
+    except ValueError:
+        # sql_metadata does not support some queries, their columns are just not pushed down
+        columns = None
+    return tables, columns
+
+
+def _projected_usecols(sql: str, table: str, header: list) -> Optional[List[int]]:
+    """Returns positions of header columns used by single table SQL query, or None when
+    all of them are used or some column cannot be matched with exactly one header cell."""
+    columns = _parse_sql(sql)[1]
+    if columns is None:
+        return None
+    # DuckDB identifiers are case insensitive, also when quoted
+    positions: Dict[str, List[int]] = {}
+    for position, name in enumerate(header):
+        positions.setdefault(str(name).lower(), []).append(position)
+    usecols = set()
+    for column in columns:
+        if column.startswith(f"{table}."):
+            column = column[len(table) + 1 :]
+        matches = positions.get(column.lower(), [])
+        if len(matches) != 1:
+            return None
+        usecols.add(matches[0])
+    if len(usecols) == len(header):
+        return None
+    return sorted(usecols)
+
+
+def _limit_sql(sql: str, nrows: Optional[int]) -> str:
+    """Wraps SQL query with LIMIT, which DuckDB pushes down into the query plan."""
+    if nrows is None:
+        return sql
+    return f"SELECT * FROM ({sql.strip().rstrip(';')}) LIMIT {int(nrows)}"
+
+
+# header of column without name given by pandas parsers, the same pattern gspread_dataframe uses
+_UNNAMED_COLUMN_RE = re.compile(r"^Unnamed:\s\d+(?:_level_\d+)?$")
+
+
+def _is_unnamed_column(label) -> bool:
+    if isinstance(label, str):
+        return _UNNAMED_COLUMN_RE.search(label) is not None
+    if isinstance(label, tuple):
+        return all(_is_unnamed_column(item) for item in label)
+    # with header=None columns are labeled by their positions
+    return isinstance(label, integer)
+
+
+def _values_to_dataframe(
+    values: List[list],
+    shape: Optional[Tuple[int, int]] = None,
+    drop_empty_rows: bool = True,
+    drop_empty_columns: bool = True,
+    **options,
+) -> DataFrame:
+    """Parses Sheets API values into DataFrame, same way as gspread_dataframe.get_as_dataframe.
+    Like there, values are padded with empty cells to shape (rows, columns) of the worksheet grid,
+    as they change inferred dtypes (e.g. integers with empty cells are floats), then empty rows
+    and empty columns without header are dropped."""
+    from gspread.utils import fill_gaps  # noqa: PLC0415
+
+    rows, cols = shape if shape is not None else (None, None)
+    values = fill_gaps(values, rows=rows, cols=cols)
+    if not values:
+        return DataFrame()
+    df = TextParser(values, **options).read(options.get("nrows"))
+    # levels of MultiIndex keep dropped labels, it is built again from the remaining ones
+    if drop_empty_rows:
+        df = df.dropna(how="all", axis=0)
+        if isinstance(df.index, MultiIndex):
+            df.index = MultiIndex.from_tuples(df.index.to_numpy())
+    if drop_empty_columns:
+        labels = [label for label in df.columns.to_numpy() if _is_unnamed_column(label) and df[label].isna().all()]
+        if labels:
+            df = df.drop(labels=labels, axis=1)
+            if isinstance(df.columns, MultiIndex):
+                df.columns = MultiIndex.from_tuples(df.columns.to_numpy())
+    return df
+
+
+def _range_sheet(range_name: str) -> str:
+    """Returns worksheet part of absolute A1 range, e.g. "'Sheet 1'" of "'Sheet 1'!A1"."""
+    return range_name.rsplit("!", 1)[0]
+
+
+def _connect_duckdb() -> duckdb.DuckDBPyConnection:
+    """Returns new in-memory DuckDB database. DuckDB is imported on first
+    query, apps which only read worksheets don't pay for its import."""
+    import duckdb  # noqa: PLC0415
+
+    # bounded memory with spilling to disk, so worksheets larger than RAM can be queried without OOM
+    return duckdb.connect(
+        config={
+            "memory_limit": "2GB",
+            "temp_directory": os.path.join(tempfile.gettempdir(), "duckdb_swap"),
+            "max_temp_directory_size": "10GB",
+            "threads": os.cpu_count() or 1,
+        }
+    )
+
+
+def _register_dataframe(in_memory_db: duckdb.DuckDBPyConnection, name: str, df: DataFrame) -> None:
+    """Registers DataFrame as DuckDB view, scanned in place without copying it into a table.
+    DataFrames with pyarrow backed columns (dtype_backend="pyarrow", pandas>=3 strings) are
+    registered as Arrow table, which DuckDB scans natively and much faster than through pandas."""
+    if any(
+        isinstance(dtype, ArrowDtype) or (isinstance(dtype, StringDtype) and dtype.storage == "pyarrow")
+        for dtype in df.dtypes
+    ):
+        from pyarrow import ArrowException, Table  # noqa: PLC0415
+
+        try:
+            in_memory_db.register(name, Table.from_pandas(df, preserve_index=False))
+            return
+        except ArrowException:
+            # e.g. object column with mixed value types, such DataFrame is scanned through pandas
+            pass
+    in_memory_db.register(name, df)
+
+
+def _to_arrow_reader(in_memory_db: duckdb.DuckDBPyConnection, sql: str, batch_size: int) -> RecordBatchReader:
+    """Executes SQL and returns its results as stream of Arrow RecordBatches."""
+    in_memory_db.execute(sql)
+    # to_arrow_reader replaces deprecated fetch_record_batch since DuckDB 1.4
+    if hasattr(in_memory_db, "to_arrow_reader"):
+        return in_memory_db.to_arrow_reader(batch_size)
+    return in_memory_db.fetch_record_batch(batch_size)
+
 
 class GSheetsClient(ABC):
     _optional_client: Optional[GSpreadClient] = None
@@ -46,8 +660,28 @@ class GSheetsClient(ABC):
     def __init__(self, secrets_dict: dict):
         self._spreadsheet = secrets_dict.pop("spreadsheet", None)
         self._worksheet = secrets_dict.pop("worksheet", None)
+        # cached functions created by read/query, cache entries are shared by all their instances
+        # (cache_resource keeps DataFrames unpickled, they are copied for each caller instead)
+        self._cached_functions: Dict[str, CachedFunc] = {}
+        self._duckdb: Optional[duckdb.DuckDBPyConnection] = None
+        self._duckdb_lock = threading.Lock()
         if secrets_dict.get("type") == "service_account":
-            self._optional_client = service_account_from_dict(secrets_dict)
+            self._optional_client = _service_account_client(secrets_dict)
+
+    def clear_cache(self) -> None:
+        # cached functions are keyed by their code, not by client, so all their entries are cleared
+        for cached_function in list(self._cached_functions.values()):
+            cached_function.clear()
+
+    def _duckdb_cursor(self) -> duckdb.DuckDBPyConnection:
+        """Returns new cursor of client's DuckDB database, created on first query and reused
+        afterwards. Client is shared between sessions and DuckDB connection must not run queries
+        from several threads, each query gets its own cursor; worksheets registered and temporary
+        tables created in the cursor are private to it, so concurrent queries don't collide."""
+        with self._duckdb_lock:
+            if self._duckdb is None:
+                self._duckdb = _connect_duckdb()
+        return self._duckdb.cursor()
 
     def set_default(
         self,
@@ -66,12 +700,29 @@ class GSheetsClient(ABC):
         worksheet: Optional[Union[int, str]] = None,
         ttl: Optional[Union[int, timedelta, None]] = 3600,
         max_entries: Optional[Union[int, None]] = None,
+        max_cache_mb: Optional[float] = None,
         evaluate_formulas: bool = True,
         folder_id: Optional[str] = None,
+        persist: Optional[str] = None,
+        nrows: Optional[int] = None,
         **options,
     ) -> DataFrame:
         raise NotImplementedError
 
+    @abstractmethod
+    def batch_read(
+        self,
+        worksheets: List[Union[int, str]],
+        *,  # keyword-only arguments:
+        spreadsheet: Optional[str] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        evaluate_formulas: bool = True,
+        folder_id: Optional[str] = None,
+        **options,
+    ) -> List[DataFrame]:
+        raise NotImplementedError
+
     @abstractmethod
     def query(
         self,
@@ -81,12 +732,32 @@ class GSheetsClient(ABC):
         worksheet: Optional[Union[int, str]] = None,
         ttl: Optional[Union[int, timedelta, None]] = 3600,
         max_entries: Optional[Union[int, None]] = None,
+        max_cache_mb: Optional[float] = None,
         evaluate_formulas: bool = True,
         folder_id: Optional[str] = None,
+        nrows: Optional[int] = None,
+        pushdown: bool = False,
         **options,
     ) -> DataFrame:
         raise NotImplementedError
 
+    @abstractmethod
+    def query_arrow(
+        self,
+        sql: str,
+        *,  # keyword-only arguments:
+        spreadsheet: Optional[str] = None,
+        worksheet: Optional[Union[int, str]] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        evaluate_formulas: bool = True,
+        folder_id: Optional[str] = None,
+        batch_size: int = 2048,
+        nrows: Optional[int] = None,
+        **options,
+    ) -> RecordBatchReader:
+        raise NotImplementedError
+
     @abstractmethod
     def create(
         self,
@@ -95,6 +766,7 @@ class GSheetsClient(ABC):
         worksheet: Optional[str] = None,
         data: Optional[Union[DataFrame, ndarray, List[list], List[dict]]] = None,
         folder_id: Optional[str] = None,
+        format: bool = False,
     ) -> DataFrame | None:
         raise NotImplementedError
 
@@ -106,6 +778,7 @@ class GSheetsClient(ABC):
         worksheet: Optional[Union[str, int, Worksheet]] = None,
         data: Optional[Union[DataFrame, ndarray, List[list], List[dict]]] = None,
         folder_id: Optional[str] = None,
+        format: bool = False,
     ) -> DataFrame | None:
         raise NotImplementedError
 
@@ -119,11 +792,82 @@ class GSheetsClient(ABC):
     ) -> dict:
         raise NotImplementedError
 
+    @abstractmethod
+    def batch(self) -> ContextManager[None]:
+        raise NotImplementedError
+
 
 class GSheetsServiceAccountClient(GSheetsClient):
     def __init__(self, secrets_dict: dict):
         super().__init__(secrets_dict)
-        self._client = cast(GSpreadClient, self._optional_client)
+        self._client = cast("GSpreadClient", self._optional_client)
+        # client is shared between Streamlit sessions, each session runs in its own thread
+        self._batch_state = threading.local()
+        # opened spreadsheets by (spreadsheet, folder_id), opening costs Drive/Sheets API requests;
+        # their worksheets are not kept, gspread fetches them fresh on each worksheet() call
+        self._spreadsheet_cache: Dict[Tuple[str, Optional[str]], Spreadsheet] = {}
+
+    def clear_cache(self) -> None:
+        super().clear_cache()
+        self._spreadsheet_cache.clear()
+
+    def _pending_batch(self) -> Optional[List[Tuple[str, Spreadsheet, Union[str, dict]]]]:
+        return getattr(self._batch_state, "requests", None)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        if self._pending_batch() is not None:
+            yield
+            return
+
+        self._batch_state.requests = []
+        try:
+            yield
+            requests = self._pending_batch() or []
+        finally:
+            self._batch_state.requests = None
+
+        # all writes to a spreadsheet are sent as one values.batchClear followed by one values.batchUpdate;
+        # clear of a worksheet discards its updates queued before, so the result is the same as of calls in order
+        batches: Dict[str, Tuple[Spreadsheet, List[str], List[dict]]] = {}
+        for kind, spreadsheet, payload in requests:
+            _, clears, updates = batches.setdefault(spreadsheet.id, (spreadsheet, [], []))
+            if kind == "clear":
+                clears.append(cast(str, payload))
+                updates[:] = [update for update in updates if _range_sheet(update["range"]) != payload]
+            else:
+                updates.append(cast(dict, payload))
+        for spreadsheet, clears, updates in batches.values():
+            if clears:
+                spreadsheet.values_batch_clear(body={"ranges": clears})
+            if updates:
+                spreadsheet.values_batch_update(body={"valueInputOption": "USER_ENTERED", "data": updates})
+
+    def _write_dataframe(self, worksheet: Worksheet, data: DataFrame, format: bool = False) -> None:
+        # worksheet is grown to fit the data, cells are never removed by a write
+        n_rows, n_cols = data.shape[0] + data.columns.nlevels, data.shape[1]
+        if worksheet.row_count < n_rows or worksheet.col_count < n_cols:
+            worksheet.resize(rows=max(n_rows, worksheet.row_count), cols=max(n_cols, worksheet.col_count))
+
+        from gspread.utils import absolute_range_name  # noqa: PLC0415
+
+        # all values, column header included, are written by a single values.update request
+        value_range = {"range": absolute_range_name(worksheet.title, "A1"), "values": _dataframe_to_values(data)}
+        requests = self._pending_batch()
+        if requests is None:
+            worksheet.spreadsheet.values_update(
+                value_range["range"],
+                params={"valueInputOption": "USER_ENTERED"},
+                body={"values": value_range["values"]},
+            )
+        else:
+            requests.append(("update", worksheet.spreadsheet, value_range))
+
+        if format:
+            # gspread_formatting is needed only when formatting is requested
+            from gspread_formatting.dataframe import format_with_dataframe as set_format_with_dataframe  # noqa: PLC0415
+
+            set_format_with_dataframe(worksheet, data, include_column_header=True)
 
     def _open_spreadsheet(
         self,
@@ -131,7 +875,9 @@ class GSheetsServiceAccountClient(GSheetsClient):
         spreadsheet: Optional[Union[str, Spreadsheet]] = None,
         folder_id: Optional[str] = None,
     ) -> Spreadsheet:
-        if type(spreadsheet) is Spreadsheet:
+        from gspread.spreadsheet import Spreadsheet  # noqa: PLC0415
+
+        if isinstance(spreadsheet, Spreadsheet):
             return spreadsheet
 
         if not spreadsheet and self._spreadsheet:
@@ -139,12 +885,18 @@ class GSheetsServiceAccountClient(GSheetsClient):
         if not folder_id and self._worksheet:
             folder_id = self._worksheet
 
-        try:
-            if validate_url(spreadsheet):
-                return self._client.open_by_url(url=spreadsheet)
-            raise ValueError(f"spreadsheet is not URL: {spreadsheet}")
-        except ValueError:
-            return self._client.open(title=spreadsheet, folder_id=folder_id)
+        cache_key = (cast(str, spreadsheet), folder_id)
+        opened_spreadsheet = self._spreadsheet_cache.get(cache_key)
+        if opened_spreadsheet is not None:
+            return opened_spreadsheet
+
+        # prefix check skips validators regexes for spreadsheet names
+        if isinstance(spreadsheet, str) and spreadsheet.startswith(("http://", "https://")) and validate_url(spreadsheet):
+            opened_spreadsheet = self._client.open_by_url(url=spreadsheet)
+        else:
+            opened_spreadsheet = self._client.open(title=spreadsheet, folder_id=folder_id)
+        self._spreadsheet_cache[cache_key] = opened_spreadsheet
+        return opened_spreadsheet
 
     def _select_worksheet(
         self,
@@ -153,7 +905,9 @@ class GSheetsServiceAccountClient(GSheetsClient):
         worksheet: Optional[Union[str, int, Worksheet]] = None,
         folder_id: Optional[str] = None,
     ) -> Worksheet:
-        if type(worksheet) is Worksheet:
+        from gspread.worksheet import Worksheet  # noqa: PLC0415
+
+        if isinstance(worksheet, Worksheet):
             return worksheet
 
         if spreadsheet is None and self._spreadsheet:
@@ -180,30 +934,157 @@ class GSheetsServiceAccountClient(GSheetsClient):
         worksheet: Optional[Union[int, str]] = None,
         ttl: Optional[Union[int, timedelta, None]] = 3600,
         max_entries: Optional[Union[int, None]] = None,
+        max_cache_mb: Optional[float] = None,
         evaluate_formulas: bool = True,
         folder_id: Optional[str] = None,
+        persist: Optional[str] = None,
+        nrows: Optional[int] = None,
         **options,
     ) -> DataFrame:
+        if persist not in (None, "parquet"):
+            raise ValueError(f"Unsupported persist option: {persist}")
         if not spreadsheet and self._spreadsheet:
             spreadsheet = self._spreadsheet
         if not folder_id and self._worksheet:
             folder_id = self._worksheet
+        if nrows is not None:
+            options["nrows"] = nrows
 
-        @cache_data(ttl=ttl, max_entries=max_entries)
-        def _get_as_dataframe(spreadsheet, folder_id, worksheet, evaluate_formulas, **options):
-            return get_as_dataframe(
-                worksheet=self._select_worksheet(spreadsheet=spreadsheet, folder_id=folder_id, worksheet=worksheet),
-                evaluate_formulas=evaluate_formulas,
-                **options,
+        size_name = f"{type(self).__qualname__}.read"
+
+        @cache_resource(ttl=ttl, max_entries=max_entries)
+        def _get_as_dataframe(spreadsheet, folder_id, worksheet, evaluate_formulas, persist, options_key, _options):
+            selected_worksheet = self._select_worksheet(spreadsheet=spreadsheet, folder_id=folder_id, worksheet=worksheet)
+            if persist is None:
+                df = self._worksheet_to_dataframe(selected_worksheet, evaluate_formulas, **_options)
+            else:
+                # persisted DataFrame is valid as long as the spreadsheet was not modified since it was written
+                spreadsheet_id = selected_worksheet.spreadsheet.id
+                path = _parquet_cache_path(
+                    (spreadsheet_id, selected_worksheet.id, evaluate_formulas, options_key),
+                    version=self._client.get_file_drive_metadata(spreadsheet_id)["modifiedTime"],
+                )
+                df = _load_parquet_cache(path)
+                if df is None:
+                    df = self._worksheet_to_dataframe(selected_worksheet, evaluate_formulas, **_options)
+                    _save_parquet_cache(path, df)
+            return _bound_cache_size(
+                size_name,
+                _get_as_dataframe,
+                (spreadsheet, folder_id, worksheet, evaluate_formulas, persist, options_key, _options),
+                df,
+                max_cache_mb=max_cache_mb,
+                ttl=ttl,
+                max_entries=max_entries,
             )
 
+        self._cached_functions["read"] = _get_as_dataframe
         return _get_as_dataframe(
             spreadsheet,
             folder_id,
             worksheet,
             evaluate_formulas,
-            **options,
+            persist,
+            _options_key(options),
+            options,
+        ).copy()
+
+    def _worksheet_to_dataframe(self, worksheet: Worksheet, evaluate_formulas: bool, **options) -> DataFrame:
+        nrows = options.get("nrows")
+        usecols = options.get("usecols")
+        select_columns = (
+            isinstance(usecols, (list, tuple)) and len(usecols) > 0 and all(type(column) is int for column in usecols)
         )
+        if (nrows is None and not select_columns) or "header" in options or "skiprows" in options:
+            from gspread_dataframe import get_as_dataframe  # noqa: PLC0415
+
+            return get_as_dataframe(worksheet=worksheet, evaluate_formulas=evaluate_formulas, **options)
+
+        from gspread.utils import absolute_range_name, rowcol_to_a1  # noqa: PLC0415
+
+        # only the header row and first nrows rows are fetched from Google API
+        last_row = "" if nrows is None else int(nrows) + 1
+        n_rows = worksheet.row_count if nrows is None else min(int(nrows) + 1, worksheet.row_count)
+        if not select_columns:
+            response = _values_get(
+                worksheet.spreadsheet,
+                absolute_range_name(worksheet.title, f"1:{last_row}"),
+                _value_render_params(evaluate_formulas),
+            )
+            return _values_to_dataframe(response.get("values", []), (n_rows, worksheet.col_count), **options)
+
+        # only the header row and selected columns are fetched, each as its own range of one
+        # values.batchGet call; they're put back into the worksheet grid with other cells empty and
+        # parsed with usecols like by get_as_dataframe, so header names, blank rows and dtypes match
+        columns = sorted(set(cast(List[int], usecols)))
+        letters = [rowcol_to_a1(1, column + 1)[:-1] for column in columns]
+        response = _values_batch_get(
+            worksheet.spreadsheet,
+            [
+                absolute_range_name(worksheet.title, "1:1"),
+                *(absolute_range_name(worksheet.title, f"{letter}1:{letter}{last_row}") for letter in letters),
+            ],
+            {**_value_render_params(evaluate_formulas), "majorDimension": "COLUMNS"},
+        )
+        header_range, *column_ranges = response.get("valueRanges", [{}])
+        columns_values = [(value_range.get("values") or [[]])[0] for value_range in column_ranges]
+        values = [[cells[0] if cells else "" for cells in header_range.get("values", [])]]
+        values.extend([""] * worksheet.col_count for _ in range(max(map(len, columns_values), default=1) - 1))
+        for position, column_values in enumerate(columns_values):
+            # columns beyond the grid are left to TextParser, which rejects them as get_as_dataframe does
+            if columns[position] < worksheet.col_count:
+                for row, value in enumerate(column_values[1:], start=1):
+                    values[row][columns[position]] = value
+        return _values_to_dataframe(values, (n_rows, worksheet.col_count), **options)
+
+    def batch_read(
+        self,
+        worksheets: List[Union[int, str]],
+        *,  # keyword-only arguments:
+        spreadsheet: Optional[str] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        evaluate_formulas: bool = True,
+        folder_id: Optional[str] = None,
+        **options,
+    ) -> List[DataFrame]:
+        if not spreadsheet and self._spreadsheet:
+            spreadsheet = self._spreadsheet
+        if not folder_id and self._worksheet:
+            folder_id = self._worksheet
+
+        @cache_resource(ttl=ttl, max_entries=max_entries)
+        def _batch_get_as_dataframes(spreadsheet, folder_id, worksheets, evaluate_formulas, options_key, _options):  # noqa: ARG001
+            from gspread.utils import absolute_range_name  # noqa: PLC0415
+
+            opened_spreadsheet = self._open_spreadsheet(spreadsheet=spreadsheet, folder_id=folder_id)
+            # one listing of worksheets resolves indexes and gives grid sizes, to which values are padded
+            # like in read, not a request per worksheet
+            listed = opened_spreadsheet.worksheets()
+            by_title = {sheet.title: sheet for sheet in listed}
+            sheets = [by_title[worksheet] if isinstance(worksheet, str) else listed[worksheet] for worksheet in worksheets]
+            response = _values_batch_get(
+                opened_spreadsheet,
+                [absolute_range_name(sheet.title) for sheet in sheets],
+                _value_render_params(evaluate_formulas),
+            )
+            return [
+                _values_to_dataframe(
+                    value_range.get("values", []), (sheets[position].row_count, sheets[position].col_count), **_options
+                )
+                for position, value_range in enumerate(response.get("valueRanges", []))
+            ]
+
+        self._cached_functions["batch_read"] = _batch_get_as_dataframes
+        dfs = _batch_get_as_dataframes(
+            spreadsheet,
+            folder_id,
+            tuple(worksheets),
+            evaluate_formulas,
+            _options_key(options),
+            options,
+        )
+        return [df.copy() for df in dfs]
 
     def query(
         self,
@@ -213,8 +1094,11 @@ class GSheetsServiceAccountClient(GSheetsClient):
         spreadsheet: Optional[str] = None,
         ttl: Optional[Union[int, timedelta, None]] = 3600,
         max_entries: Optional[Union[int, None]] = None,
+        max_cache_mb: Optional[float] = None,
         evaluate_formulas: bool = True,
         folder_id: Optional[str] = None,
+        nrows: Optional[int] = None,
+        pushdown: bool = False,
         **options,
     ) -> DataFrame:
         if worksheet is None and self._worksheet:
@@ -224,30 +1108,135 @@ class GSheetsServiceAccountClient(GSheetsClient):
         if folder_id is None and self._worksheet:
             folder_id = self._worksheet
 
-        @cache_data(ttl=ttl, max_entries=max_entries)
-        def _query(sql, spreadsheet, folder_id, evaluate_formulas, **options):
-            in_memory_db = duckdb.connect()
-            for worksheet in Parser(sql).tables:
-                df = DataFrame()
-                create_table_sql = f'CREATE TABLE "{worksheet}" AS SELECT * FROM df'
-                if not self._select_worksheet(spreadsheet=spreadsheet, folder_id=folder_id, worksheet=worksheet):
-                    in_memory_db.sql(create_table_sql)
-                    _ = df
-                    continue
-                df = self.read(
+        size_name = f"{type(self).__qualname__}.query"
+
+        @cache_resource(ttl=ttl, max_entries=max_entries)
+        def _query(sql, nrows, spreadsheet, folder_id, evaluate_formulas, pushdown, options_key, _options):
+            in_memory_db = self._duckdb_cursor()
+            try:
+                self._register_worksheets(
+                    in_memory_db,
+                    sql,
                     spreadsheet=spreadsheet,
                     folder_id=folder_id,
-                    worksheet=worksheet,
                     ttl=ttl,
                     max_entries=max_entries,
                     evaluate_formulas=evaluate_formulas,
-                    **options,
+                    pushdown=pushdown,
+                    **_options,
                 )
-                in_memory_db.sql(create_table_sql)
-                _ = df
-            return in_memory_db.sql(query=sql).to_df()
+                return _bound_cache_size(
+                    size_name,
+                    _query,
+                    (sql, nrows, spreadsheet, folder_id, evaluate_formulas, pushdown, options_key, _options),
+                    in_memory_db.execute(_limit_sql(sql, nrows)).fetch_df(),
+                    max_cache_mb=max_cache_mb,
+                    ttl=ttl,
+                    max_entries=max_entries,
+                )
+            finally:
+                # releases registered worksheets, cursor of query_arrow is released with its reader
+                in_memory_db.close()
+
+        self._cached_functions["query"] = _query
+        return _query(sql, nrows, spreadsheet, folder_id, evaluate_formulas, pushdown, _options_key(options), options).copy()
+
+    def query_arrow(
+        self,
+        sql: str,
+        *,  # keyword-only arguments:
+        worksheet: Optional[Union[int, str]] = None,  # noqa: ARG002
+        spreadsheet: Optional[str] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        evaluate_formulas: bool = True,
+        folder_id: Optional[str] = None,
+        batch_size: int = 2048,
+        nrows: Optional[int] = None,
+        **options,
+    ) -> RecordBatchReader:
+        if spreadsheet is None and self._spreadsheet:
+            spreadsheet = self._spreadsheet
+        if folder_id is None and self._worksheet:
+            folder_id = self._worksheet
 
-        return _query(sql, spreadsheet, folder_id, evaluate_formulas, **options)
+        in_memory_db = self._duckdb_cursor()
+        try:
+            self._register_worksheets(
+                in_memory_db,
+                sql,
+                spreadsheet=spreadsheet,
+                folder_id=folder_id,
+                ttl=ttl,
+                max_entries=max_entries,
+                evaluate_formulas=evaluate_formulas,
+                **options,
+            )
+            return _to_arrow_reader(in_memory_db, _limit_sql(sql, nrows), batch_size)
+        except BaseException:
+            # cursor is released with the reader, without one it's released here
+            in_memory_db.close()
+            raise
+
+    def _register_worksheets(
+        self,
+        in_memory_db: duckdb.DuckDBPyConnection,
+        sql: str,
+        *,  # keyword-only arguments:
+        spreadsheet: Optional[str] = None,
+        folder_id: Optional[str] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        evaluate_formulas: bool = True,
+        pushdown: bool = False,
+        **options,
+    ) -> None:
+        tables = _parse_sql(sql)[0]
+        if not tables:
+            # e.g. SELECT 1 uses no worksheet, spreadsheet is not even opened
+            return
+        opened_spreadsheet = self._open_spreadsheet(spreadsheet=spreadsheet, folder_id=folder_id)
+        # worksheet titles are listed by one request, tables of SQL which are not worksheets
+        # (e.g. CTE names) are left to DuckDB
+        titles = {sheet.title for sheet in opened_spreadsheet.worksheets()}
+        worksheets: List[Union[int, str]] = [table for table in tables if table in titles]
+        if pushdown and len(worksheets) == 1 and not options:
+            from gspread.utils import absolute_range_name  # noqa: PLC0415
+
+            # header row tells which columns SQL uses, only those are fetched by read
+            table = str(worksheets[0])
+            response = _values_get(
+                opened_spreadsheet,
+                absolute_range_name(table, "1:1"),
+                _value_render_params(evaluate_formulas),
+            )
+            usecols = _projected_usecols(sql, table, (response.get("values") or [[]])[0])
+            if usecols is not None:
+                df = self.read(
+                    spreadsheet=spreadsheet,
+                    folder_id=folder_id,
+                    worksheet=table,
+                    ttl=ttl,
+                    max_entries=max_entries,
+                    evaluate_formulas=evaluate_formulas,
+                    usecols=usecols,
+                )
+                _register_dataframe(in_memory_db, table, df)
+                return
+        if not worksheets:
+            return
+        # all worksheets used in SQL are fetched by single values.batchGet request
+        dfs = self.batch_read(
+            worksheets,
+            spreadsheet=spreadsheet,
+            folder_id=folder_id,
+            ttl=ttl,
+            max_entries=max_entries,
+            evaluate_formulas=evaluate_formulas,
+            **options,
+        )
+        for position, title in enumerate(worksheets):
+            _register_dataframe(in_memory_db, str(title), dfs[position])
 
     def create(
         self,
@@ -256,6 +1245,7 @@ class GSheetsServiceAccountClient(GSheetsClient):
         worksheet: Optional[str] = None,
         data: Optional[Union[DataFrame, ndarray, List[list], List[dict]]] = None,
         folder_id: Optional[str] = None,
+        format: bool = False,
     ) -> DataFrame | None:
         if not spreadsheet and self._spreadsheet:
             spreadsheet = self._spreadsheet
@@ -264,16 +1254,15 @@ class GSheetsServiceAccountClient(GSheetsClient):
         if not folder_id and self._worksheet:
             folder_id = self._worksheet
 
+        from gspread.client import SpreadsheetNotFound  # noqa: PLC0415
+
         try:
             new_spreadsheet = self._open_spreadsheet(spreadsheet=spreadsheet, folder_id=folder_id)
         except SpreadsheetNotFound:
             new_spreadsheet = self._client.create(title=spreadsheet, folder_id=folder_id)
 
-        if is_dataframe_like(data):
-            return_data = convert_anything_to_pandas_df(data)
-        elif type(data) is ndarray:
-            return_data = DataFrame.from_records(data)
-        else:
+        return_data = _to_dataframe(data)
+        if return_data is None:
             new_spreadsheet.add_worksheet(
                 title=worksheet,
                 rows=0,
@@ -283,10 +1272,12 @@ class GSheetsServiceAccountClient(GSheetsClient):
 
         n_rows, n_cols = return_data.shape
 
-        new_worksheet = new_spreadsheet.add_worksheet(title=worksheet, rows=n_rows, cols=n_cols)
+        # extra rows for the column header, so the worksheet does not have to be resized on write
+        new_worksheet = new_spreadsheet.add_worksheet(
+            title=worksheet, rows=n_rows + return_data.columns.nlevels, cols=n_cols
+        )
 
-        set_with_dataframe(new_worksheet, return_data)
-        set_format_with_dataframe(new_worksheet, return_data, include_column_header=True)
+        self._write_dataframe(new_worksheet, return_data, format=format)
 
         return return_data
 
@@ -297,6 +1288,7 @@ class GSheetsServiceAccountClient(GSheetsClient):
         worksheet: Optional[Union[str, int, Worksheet]] = None,
         data: Optional[Union[DataFrame, ndarray, List[list], List[dict]]] = None,
         folder_id: Optional[str] = None,
+        format: bool = False,
     ) -> DataFrame | None:
         if not spreadsheet and self._spreadsheet:
             spreadsheet = self._spreadsheet
@@ -308,11 +1300,8 @@ class GSheetsServiceAccountClient(GSheetsClient):
 
         worksheet = self._select_worksheet(spreadsheet=spreadsheet, folder_id=folder_id, worksheet=worksheet)
 
-        if is_dataframe_like(data):
-            data = convert_anything_to_pandas_df(data)
-        elif type(data) is ndarray:
-            data = DataFrame.from_records(data)
-        else:
+        data = _to_dataframe(data)
+        if data is None:
             return None
 
         if worksheet:
@@ -321,8 +1310,7 @@ class GSheetsServiceAccountClient(GSheetsClient):
                 folder_id=folder_id,
                 worksheet=worksheet,
             )
-        set_with_dataframe(worksheet, data)
-        set_format_with_dataframe(worksheet, data, include_column_header=True)
+        self._write_dataframe(worksheet, data, format=format)
         return data
 
     def clear(
@@ -332,7 +1320,14 @@ class GSheetsServiceAccountClient(GSheetsClient):
         worksheet: Optional[Union[str, int, Worksheet]] = None,
         folder_id: Optional[str] = None,
     ) -> dict:
-        return self._select_worksheet(spreadsheet=spreadsheet, worksheet=worksheet, folder_id=folder_id).clear()
+        selected_worksheet = self._select_worksheet(spreadsheet=spreadsheet, worksheet=worksheet, folder_id=folder_id)
+        requests = self._pending_batch()
+        if requests is None:
+            return selected_worksheet.clear()
+        from gspread.utils import absolute_range_name  # noqa: PLC0415
+
+        requests.append(("clear", selected_worksheet.spreadsheet, absolute_range_name(selected_worksheet.title)))
+        return {}
 
 
 class UnsupportedOperationError(Exception):
@@ -340,42 +1335,33 @@ class UnsupportedOperationError(Exception):
 
 
 class GSheetsPublicSpreadsheetClient(GSheetsClient):
+    def clear_cache(self) -> None:
+        super().clear_cache()
+        # downloaded exports are shared by all public clients, they are downloaded again on next read
+        with _CSV_EXPORTS_LOCK:
+            _CSV_EXPORTS.clear()
+
     def _get_download_as_csv_url(
         self,
         *,  # keyword-only arguments:
         spreadsheet: str,
         worksheet: str | int | None = None,
     ) -> str:
-        validation_failure = ValueError(f"spreadsheet validation failure for {spreadsheet}")
-        try:
-            if validate_url(spreadsheet):  # type: ignore
-                r = re.compile(r"\/d\/.+?(?=\/)")
-                found_ids = r.findall(spreadsheet)
-                if len(found_ids) < 1:
-                    raise validation_failure
-                key = found_ids[0][3:]
-                parsed_url = urlparse(spreadsheet)
-                parsed_qs = parse_qs(parsed_url.query)  # type: ignore
-                frag = parsed_url.fragment
-                gid_re = re.compile(r"gid=\w+")
-                found_gids = gid_re.findall(frag)  # type: ignore
-                final_gid = None
-                if len(found_gids) > 0:
-                    final_gid = found_gids[0][4:]
-                elif parsed_qs.get("gid", []) and len(parsed_qs.get("gid", [])) > 0:  # type: ignore
-                    final_gid = parsed_qs.get("gid", [""])[0]  # type: ignore
-                if worksheet:
-                    final_gid = worksheet
-                url = f"https://docs.google.com/spreadsheet/ccc?key={key}&output=csv"
+        # prefix check skips validators regexes for spreadsheet keys
+        if isinstance(spreadsheet, str) and spreadsheet.startswith(("http://", "https://")) and validate_url(spreadsheet):
+            match = _URL_RE.search(spreadsheet)
+            if match is not None:
+                final_gid = worksheet or match["fragment_gid"] or match["query_gid"]
+                url = _CSV_EXPORT_URL.format(key=match["key"])
                 if final_gid:
                     return f"{url}&gid={final_gid}"
                 return url
-            raise validation_failure
-        except (ValueError, TypeError):
-            url = f"https://docs.google.com/spreadsheet/ccc?key={spreadsheet}&output=csv"
-            if worksheet:
-                return f"{url}&gid={worksheet}"
-            return url
+
+        # otherwise spreadsheet is the spreadsheet key itself
+        url = _CSV_EXPORT_URL.format(key=spreadsheet)
+        if worksheet:
+            return f"{url}&gid={worksheet}"
+        return url
 
     def read(
         self,
@@ -384,8 +1370,15 @@ class GSheetsPublicSpreadsheetClient(GSheetsClient):
         worksheet: Optional[Union[int, str]] = None,
         ttl: Optional[Union[int, timedelta, None]] = 3600,
         max_entries: Optional[Union[int, None]] = None,
+        max_cache_mb: Optional[float] = None,
+        persist: Optional[str] = None,
+        nrows: Optional[int] = None,
         **options,
     ) -> DataFrame:
+        if persist not in (None, "parquet"):
+            raise ValueError(f"Unsupported persist option: {persist}")
+        if nrows is not None:
+            options["nrows"] = nrows
         spreadsheet = spreadsheet or self._spreadsheet
 
         if not spreadsheet:
@@ -395,14 +1388,73 @@ class GSheetsPublicSpreadsheetClient(GSheetsClient):
             worksheet = self._worksheet
         url = self._get_download_as_csv_url(spreadsheet=spreadsheet, worksheet=worksheet)
 
-        @cache_data(ttl=ttl, max_entries=max_entries)
-        def _get_as_dataframe(url: str, **options) -> DataFrame:
-            return read_csv(url, **options)
+        size_name = f"{type(self).__qualname__}.read"
+
+        @cache_resource(ttl=ttl, max_entries=max_entries)
+        def _get_as_dataframe(url: str, persist: Optional[str], options_key: object, _options: dict) -> DataFrame:
+            # downloaded export is kept in memory too (see _fetch_csv), it counts toward max_cache_mb
+            content = b""
+            df = None
+            if persist is not None:
+                # modification time of public spreadsheet is not available, persisted DataFrame expires after ttl
+                path = _parquet_cache_path((url, options_key))
+                df = _load_parquet_cache(path, ttl=ttl)
+            if df is None:
+                content = _fetch_csv(url, _ttl_seconds(ttl))
+                df = _parse_csv(content, **_options)
+                if persist is not None:
+                    _save_parquet_cache(path, df)
+            return _bound_cache_size(
+                size_name,
+                _get_as_dataframe,
+                (url, persist, options_key, _options),
+                df,
+                max_cache_mb=max_cache_mb,
+                ttl=ttl,
+                max_entries=max_entries,
+                extra_bytes=len(content),
+            )
+
+        for arg in ["evaluate_formulas", "folder_id"]:
+            options.pop(arg, None)
+
+        self._cached_functions["read"] = _get_as_dataframe
+        return _get_as_dataframe(url, persist, _options_key(options), options).copy()
+
+    def batch_read(
+        self,
+        worksheets: List[Union[int, str]],
+        *,  # keyword-only arguments:
+        spreadsheet: Optional[str] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        **options,
+    ) -> List[DataFrame]:
+        spreadsheet = spreadsheet or self._spreadsheet
+
+        if not spreadsheet:
+            raise ValueError("Spreadsheet must be specified")
+
+        urls = tuple(self._get_download_as_csv_url(spreadsheet=spreadsheet, worksheet=worksheet) for worksheet in worksheets)
+        if not urls:
+            return []
+
+        @cache_resource(ttl=ttl, max_entries=max_entries)
+        def _get_as_dataframes(urls: Tuple[str, ...], options_key: object, _options: dict) -> List[DataFrame]:  # noqa: ARG001
+            # every worksheet is a separate CSV export download, they are made concurrently,
+            # with at most 8 at a time to stay within Google requests quota, each export is
+            # parsed as soon as it's downloaded, while other downloads are still in flight
+            def fetch_and_parse(url: str) -> DataFrame:
+                return _parse_csv(_fetch_csv(url, _ttl_seconds(ttl)), **_options)
+
+            with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+                return list(executor.map(fetch_and_parse, urls))
 
         for arg in ["evaluate_formulas", "folder_id"]:
             options.pop(arg, None)
 
-        return _get_as_dataframe(url, **options)
+        self._cached_functions["batch_read"] = _get_as_dataframes
+        return [df.copy() for df in _get_as_dataframes(urls, _options_key(options), options)]
 
     def query(
         self,
@@ -412,6 +1464,10 @@ class GSheetsPublicSpreadsheetClient(GSheetsClient):
         worksheet: Optional[Union[int, str]] = None,
         ttl: Optional[Union[int, timedelta, None]] = 3600,
         max_entries: Optional[Union[int, None]] = None,
+        max_cache_mb: Optional[float] = None,
+        nrows: Optional[int] = None,
+        # CSV export of public spreadsheet has no column selection, whole worksheet is always read
+        pushdown: bool = False,  # noqa: ARG002
         **options,
     ) -> DataFrame:
         spreadsheet = spreadsheet or self._spreadsheet
@@ -422,20 +1478,99 @@ class GSheetsPublicSpreadsheetClient(GSheetsClient):
 
         url = self._get_download_as_csv_url(spreadsheet=spreadsheet, worksheet=worksheet)
 
-        @cache_data(ttl=ttl, max_entries=max_entries)
-        def _query(sql: str, url: str, **options):
-            in_memory_db = duckdb.connect()
-            for worksheet in Parser(sql).tables:
-                df = read_csv(url, **options)
-                create_table_sql = f'CREATE TABLE "{worksheet}" AS SELECT * FROM df'
-                in_memory_db.sql(create_table_sql)
-                _ = df
-            return in_memory_db.sql(query=sql).to_df()
+        # url is part of the cache key, worksheet is read through it in _register_worksheets
+        size_name = f"{type(self).__qualname__}.query"
+
+        @cache_resource(ttl=ttl, max_entries=max_entries)
+        def _query(sql: str, url: str, options_key: object, _options: dict):
+            in_memory_db = self._duckdb_cursor()
+            try:
+                self._register_worksheets(
+                    in_memory_db,
+                    sql,
+                    spreadsheet=spreadsheet,
+                    worksheet=worksheet,
+                    ttl=ttl,
+                    max_entries=max_entries,
+                    **_options,
+                )
+                return _bound_cache_size(
+                    size_name,
+                    _query,
+                    (sql, url, options_key, _options),
+                    in_memory_db.execute(sql).fetch_df(),
+                    max_cache_mb=max_cache_mb,
+                    ttl=ttl,
+                    max_entries=max_entries,
+                )
+            finally:
+                # releases registered worksheets, cursor of query_arrow is released with its reader
+                in_memory_db.close()
 
         for arg in ["evaluate_formulas", "folder_id"]:
             options.pop(arg, None)
 
-        return _query(sql, url, **options)
+        self._cached_functions["query"] = _query
+        return _query(_limit_sql(sql, nrows), url, _options_key(options), options).copy()
+
+    def query_arrow(
+        self,
+        sql: str,
+        *,  # keyword-only arguments:
+        spreadsheet: Optional[str] = None,
+        worksheet: Optional[Union[int, str]] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        batch_size: int = 2048,
+        nrows: Optional[int] = None,
+        **options,
+    ) -> RecordBatchReader:
+        spreadsheet = spreadsheet or self._spreadsheet
+        worksheet = worksheet or self._worksheet
+
+        if not spreadsheet:
+            raise ValueError("Spreadsheet must be specified")
+
+        for arg in ["evaluate_formulas", "folder_id"]:
+            options.pop(arg, None)
+
+        in_memory_db = self._duckdb_cursor()
+        try:
+            self._register_worksheets(
+                in_memory_db,
+                sql,
+                spreadsheet=spreadsheet,
+                worksheet=worksheet,
+                ttl=ttl,
+                max_entries=max_entries,
+                **options,
+            )
+            return _to_arrow_reader(in_memory_db, _limit_sql(sql, nrows), batch_size)
+        except BaseException:
+            # cursor is released with the reader, without one it's released here
+            in_memory_db.close()
+            raise
+
+    def _register_worksheets(
+        self,
+        in_memory_db: duckdb.DuckDBPyConnection,
+        sql: str,
+        *,  # keyword-only arguments:
+        spreadsheet: str,
+        worksheet: Optional[Union[int, str]] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        **options,
+    ) -> None:
+        # public spreadsheet is queried by GID, so every table name in SQL points to the same worksheet;
+        # it's read like by read, so DuckDB sees the same DataFrame as read returns
+        tables = _parse_sql(sql)[0]
+        if not tables:
+            # e.g. SELECT 1 uses no worksheet, nothing is downloaded
+            return
+        df = self.read(spreadsheet=spreadsheet, worksheet=worksheet, ttl=ttl, max_entries=max_entries, **options)
+        for table in tables:
+            _register_dataframe(in_memory_db, table, df)
 
     def create(self, *args, **kwargs) -> DataFrame:  # noqa: ARG002
         raise UnsupportedOperationError(
@@ -455,6 +1590,22 @@ class GSheetsPublicSpreadsheetClient(GSheetsClient):
             "use Service Account authentication to enable CRUD methods on your Spreadsheets."
         )
 
+    def batch(self):
+        raise UnsupportedOperationError(
+            "Public Spreadsheet cannot be written to, "
+            "use Service Account authentication to enable CRUD methods on your Spreadsheets."
+        )
+
+
+# markdown of connection repr, built once, only its placeholders are filled in on every render
+_REPR_HTML_TEMPLATE = """
+        ---
+        **st.connection {name}built from `{module_name}.{class_name}`**
+        {cfg}
+        - Learn more using `st.help()`
+        ---
+        """
+
 
 class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient):
     def _connect(self) -> GSheetsClient:
@@ -477,8 +1628,11 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
         worksheet: Optional[Union[int, str]] = None,
         ttl: Optional[Union[int, timedelta, None]] = 3600,
         max_entries: Optional[Union[int, None]] = None,
+        max_cache_mb: Optional[float] = None,
         evaluate_formulas: bool = True,
         folder_id: Optional[str] = None,
+        persist: Optional[str] = None,
+        nrows: Optional[int] = None,
         **options,
     ) -> DataFrame:
         """Returns the worksheet contents as a DataFrame.
@@ -499,19 +1653,42 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
         ttl : float or timedelta or None
             The maximum number of seconds to keep an entry in the cache, or
             None if cache entries should not expire. The default is None.
-            Note that ttl is incompatible with ``persist="disk"`` - ``ttl`` will be
-            ignored if ``persist`` is specified. Defaults to 3600 (1 hour).
+            With ``persist="parquet"`` ttl also governs the persisted file when you're
+            using Public Spreadsheet URL, it's downloaded again once older than ttl.
+            Defaults to 3600 (1 hour).
         max_entries : int or None
             The maximum number of entries to keep in the cache, or None
             for an unbounded cache. (When a new entry is added to a full cache,
             the oldest cached entry will be removed.) The default is None.
+        max_cache_mb: float or None
+            Approximate memory budget in megabytes of DataFrames cached by reads with max_cache_mb,
+            each counted together with its downloaded CSV export when you're using Public
+            Spreadsheet URL. When it's exceeded, the oldest cached DataFrames are removed.
+            If None, only max_entries applies. Defaults to None.
         folder_id: Google API Folder id, Optional
             Optional folder_id where your spreadsheet resides.
+        persist: "parquet" or None
+            If "parquet", worksheet contents are also persisted as parquet file
+            in ~/.cache/streamlit-gsheets, which survives app restarts and is shared
+            between processes. When you're using Service Account persisted file is used
+            until the spreadsheet is modified, otherwise until it's older than ttl.
+            Defaults to None.
+        nrows: int or None
+            Number of rows to read, not counting the column header. When you're using
+            Service Account only these rows are fetched from Google API. Defaults to None (all rows).
         options: "pandas.io.parsers.TextParser"
             All the options for pandas.io.parsers.TextParser,
                 according to the version of pandas that is installed.
-                (Note: TextParser supports only the default 'python' parser engine,
-                not the C engine.
+                (Note: when you're using Service Account, TextParser supports only
+                the 'python' parser engine. When you're using Public Spreadsheet URL,
+                options are passed to pandas.read_csv, which uses the faster C engine
+                by default, engine="pyarrow" is supported too. Without options other than
+                usecols, dtype and dtype_backend, exports are parsed by multithreaded PyArrow CSV reader.)
+                Pass dtype_backend="pyarrow" to get PyArrow backed columns, which store
+                strings as contiguous Arrow arrays instead of Python objects.
+                Pass dtype={"column": type} and parse_dates=["column"] for columns with
+                known types, they are converted without type inference, e.g.
+                dtype={"date": str, "births": "int64"}.
 
         Returns
         -----------
@@ -522,6 +1699,69 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
             worksheet=worksheet,
             ttl=ttl,
             max_entries=max_entries,
+            max_cache_mb=max_cache_mb,
+            evaluate_formulas=evaluate_formulas,
+            folder_id=folder_id,
+            persist=persist,
+            nrows=nrows,
+            **options,
+        )
+
+    def batch_read(
+        self,
+        worksheets: List[Union[int, str]],
+        *,
+        spreadsheet: Optional[str] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        evaluate_formulas: bool = True,
+        folder_id: Optional[str] = None,
+        **options,
+    ) -> List[DataFrame]:
+        """Returns contents of multiple worksheets as DataFrames. When you're
+        using Service Account all worksheets are fetched with a single
+        Google API values.batchGet call.
+
+        Parameters
+        ------------
+        worksheets: list of str or int
+            When you're using Public Spreadsheet URL its GIDs of Worksheets you'd like to read.
+            When you're using Service Account its worksheet names or worksheet indexes.
+        spreadsheet: str:
+            When you're using Service Account its spreadsheet name, otherwise its public spreadsheet URL.
+            Defaults to None. If None .streamlit/secrets.toml spreadsheet variable is used.
+        evaluate_formulas: bool
+            When you're using Public Spreadsheet URL evaluate_formulas is ignored.
+            When you're using Service Account if True, get the value of a cell after formula evaluation,
+            otherwise get the formula itself if present. Defaults to True.
+        ttl : float or timedelta or None
+            The maximum number of seconds to keep an entry in the cache, or
+            None if cache entries should not expire. The default is None.
+            Defaults to 3600 (1 hour).
+        max_entries : int or None
+            The maximum number of entries to keep in the cache, or None
+            for an unbounded cache. (When a new entry is added to a full cache,
+            the oldest cached entry will be removed.) The default is None.
+        folder_id: Google API Folder id, Optional
+            Optional folder_id where your spreadsheet resides.
+        options: "pandas.io.parsers.TextParser"
+            All the options for pandas.io.parsers.TextParser,
+                according to the version of pandas that is installed.
+                (Note: when you're using Service Account, TextParser supports only
+                the 'python' parser engine. When you're using Public Spreadsheet URL,
+                options are passed to pandas.read_csv, which uses the faster C engine
+                by default, engine="pyarrow" is supported too. Without options other than
+                usecols, dtype and dtype_backend, exports are parsed by multithreaded PyArrow CSV reader.)
+
+        Returns
+        -----------
+        dfs: list of pandas.DataFrame, in the same order as worksheets.
+        """
+        return self.client.batch_read(
+            worksheets,
+            spreadsheet=spreadsheet,
+            ttl=ttl,
+            max_entries=max_entries,
             evaluate_formulas=evaluate_formulas,
             folder_id=folder_id,
             **options,
@@ -535,8 +1775,11 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
         worksheet: Optional[Union[int, str]] = None,
         ttl: Optional[Union[int, timedelta, None]] = 3600,
         max_entries: Optional[Union[int, None]] = None,
+        max_cache_mb: Optional[float] = None,
         evaluate_formulas: bool = True,
         folder_id: Optional[str] = None,
+        nrows: Optional[int] = None,
+        pushdown: bool = False,
         **options,
     ) -> DataFrame:
         """Run SQL query against spreadsheet. Worksheet name should be used as
@@ -564,25 +1807,122 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
         ttl : float or timedelta or None
             The maximum number of seconds to keep an entry in the cache, or
             None if cache entries should not expire. The default is None.
-            Note that ttl is incompatible with ``persist="disk"`` - ``ttl`` will be
-            ignored if ``persist`` is specified. Defaults to 3600 (1 hour).
+            Defaults to 3600 (1 hour).
         max_entries : int or None
             The maximum number of entries to keep in the cache, or None
             for an unbounded cache. (When a new entry is added to a full cache,
             the oldest cached entry will be removed.) The default is None.
+        max_cache_mb: float or None
+            Approximate memory budget in megabytes of query results cached by queries with
+            max_cache_mb. When it's exceeded, the oldest cached results are removed.
+            If None, only max_entries applies. Defaults to None.
         folder_id: Google API Folder id, Optional
             Optional folder_id where your spreadsheet resides.
+        nrows: int or None
+            Maximum number of rows in query results, applied as SQL LIMIT on top
+            of your query. Defaults to None (all rows).
+        pushdown: bool
+            When you're using Public Spreadsheet URL pushdown is ignored.
+            When you're using Service Account and query selects from single worksheet
+            without parser options, only columns used in SQL are fetched from Google API
+            (header row is fetched first to find them). Rows empty in all used columns
+            are then skipped, like empty rows of the whole worksheet. Defaults to False.
         options: "pandas.io.parsers.TextParser"
             All the options for pandas.io.parsers.TextParser,
                 according to the version of pandas that is installed.
-                (Note: TextParser supports only the default 'python' parser engine,
-                not the C engine.
+                (Note: when you're using Service Account, TextParser supports only
+                the 'python' parser engine. When you're using Public Spreadsheet URL,
+                options are passed to pandas.read_csv, which uses the faster C engine
+                by default, engine="pyarrow" is supported too. Each worksheet of the query is read
+                with these options and cached the same way as by read, its DataFrame is queried by DuckDB.)
 
         Returns
         -----------
         df: pandas.DataFrame.
         """
         return self.client.query(
+            sql=sql,
+            spreadsheet=spreadsheet,
+            worksheet=worksheet,
+            ttl=ttl,
+            max_entries=max_entries,
+            max_cache_mb=max_cache_mb,
+            evaluate_formulas=evaluate_formulas,
+            folder_id=folder_id,
+            nrows=nrows,
+            pushdown=pushdown,
+            **options,
+        )
+
+    def query_arrow(
+        self,
+        sql: str,
+        *,
+        spreadsheet: Optional[str] = None,
+        worksheet: Optional[Union[int, str]] = None,
+        ttl: Optional[Union[int, timedelta, None]] = 3600,
+        max_entries: Optional[Union[int, None]] = None,
+        evaluate_formulas: bool = True,
+        folder_id: Optional[str] = None,
+        batch_size: int = 2048,
+        nrows: Optional[int] = None,
+        **options,
+    ) -> RecordBatchReader:
+        """Run SQL query against spreadsheet, same way as query does, but
+        stream results as Arrow RecordBatches instead of materializing whole
+        result as DataFrame. Worksheets are read (and cached) the same way
+        as in read, query results are not cached.
+
+        For example:
+
+            reader = conn.query_arrow('select * from "Example 1"')
+            df = reader.read_next_batch().to_pandas()
+
+        Parameters
+        ------------
+        sql: str:
+            SQL query which will query your spreadsheet.
+        spreadsheet: str:
+            When you're using Service Account its spreadsheet name, otherwise its public spreadsheet URL.
+            Defaults to None. If None .streamlit/secrets.toml spreadsheet variable is used.
+        worksheet: str or int
+            When you're using Public Spreadsheet URL its GID of Worksheet you'd like to read.
+            When you're using Service Account its worksheet name or worksheet index.
+            Defaults to None. If none .streamlit/secrets.toml worksheet variable is used.
+        evaluate_formulas: bool
+            When you're using Public Spreadsheet URL evaluate_formulas is ignored.
+            When you're using Service Account if True, get the value of a cell after formula evaluation,
+            otherwise get the formula itself if present. Defaults to True.
+        ttl : float or timedelta or None
+            The maximum number of seconds to keep an entry in the cache, or
+            None if cache entries should not expire. The default is None.
+            Defaults to 3600 (1 hour).
+        max_entries : int or None
+            The maximum number of entries to keep in the cache, or None
+            for an unbounded cache. (When a new entry is added to a full cache,
+            the oldest cached entry will be removed.) The default is None.
+        folder_id: Google API Folder id, Optional
+            Optional folder_id where your spreadsheet resides.
+        batch_size: int
+            Maximum number of rows in each RecordBatch. Defaults to 2048,
+            DuckDB vector size.
+        nrows: int or None
+            Maximum number of rows in query results, applied as SQL LIMIT on top
+            of your query. Defaults to None (all rows).
+        options: "pandas.io.parsers.TextParser"
+            All the options for pandas.io.parsers.TextParser,
+                according to the version of pandas that is installed.
+                (Note: when you're using Service Account, TextParser supports only
+                the 'python' parser engine. When you're using Public Spreadsheet URL,
+                options are passed to pandas.read_csv, which uses the faster C engine
+                by default, engine="pyarrow" is supported too. Each worksheet of the query is read
+                with these options and cached the same way as by read, its DataFrame is queried by DuckDB.)
+
+        Returns
+        -----------
+        reader: pyarrow.RecordBatchReader.
+        """
+        return self.client.query_arrow(
             sql=sql,
             spreadsheet=spreadsheet,
             worksheet=worksheet,
@@ -590,6 +1930,8 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
             max_entries=max_entries,
             evaluate_formulas=evaluate_formulas,
             folder_id=folder_id,
+            batch_size=batch_size,
+            nrows=nrows,
             **options,
         )
 
@@ -600,6 +1942,7 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
         worksheet: Optional[str] = None,
         data: Optional[Union[DataFrame, ndarray, List[list], List[dict]]] = None,
         folder_id: Optional[str] = None,
+        format: bool = False,
     ) -> DataFrame | None:
         """Creates Google Worksheet and initializes it with provided data.
 
@@ -618,12 +1961,18 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
             (will be converted to DataFrame on the fly).
         folder_id: Google API Folder id, Optional
             Optional folder_id where your spreadsheet resides.
+        format: bool
+            If True, column header and column number formats of data are applied to
+            the worksheet with gspread-formatting, an extra Google API request.
+            Defaults to False.
 
         Returns
         -----------
         df: pandas.DataFrame.
         """
-        return self.client.create(spreadsheet=spreadsheet, worksheet=worksheet, data=data, folder_id=folder_id)
+        return self.client.create(
+            spreadsheet=spreadsheet, worksheet=worksheet, data=data, folder_id=folder_id, format=format
+        )
 
     def update(
         self,
@@ -632,6 +1981,7 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
         worksheet: Optional[Union[str, int, Worksheet]] = None,
         data: Optional[Union[DataFrame, ndarray, List[list], List[dict]]] = None,
         folder_id: Optional[str] = None,
+        format: bool = False,
     ) -> DataFrame | None:
         """Updates Google Worksheet with provided data.
 
@@ -650,12 +2000,18 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
             (will be converted to DataFrame on the fly).
         folder_id: Google API Folder id, Optional
             Optional folder_id where your spreadsheet resides.
+        format: bool
+            If True, column header and column number formats of data are applied to
+            the worksheet with gspread-formatting, an extra Google API request.
+            Defaults to False.
 
         Returns
         -----------
         df: pandas.DataFrame.
         """
-        return self.client.update(spreadsheet=spreadsheet, worksheet=worksheet, data=data, folder_id=folder_id)
+        return self.client.update(
+            spreadsheet=spreadsheet, worksheet=worksheet, data=data, folder_id=folder_id, format=format
+        )
 
     def clear(
         self,
@@ -686,6 +2042,41 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
         """
         return self.client.clear(spreadsheet=spreadsheet, worksheet=worksheet, folder_id=folder_id)
 
+    def clear_cache(self) -> None:
+        """Clears cached read, batch_read and query results, so next calls fetch
+        fresh data from Google API. These caches are shared by all connections and
+        sessions of the app using the same kind of client (Service Account or Public
+        Spreadsheet URL), their cached results are cleared as well. When you're using
+        Public Spreadsheet URL, CSV exports downloaded by all public connections are
+        dropped too. Results are cached with st.cache_resource, so
+        st.cache_data.clear() does not clear them, while st.cache_resource.clear()
+        would clear all other cached resources of your app too.
+
+        For example, after updating a worksheet:
+
+            conn.update(worksheet="Example 1", data=df)
+            conn.clear_cache()
+            st.rerun()
+        """
+        return self.client.clear_cache()
+
+    def batch(self) -> ContextManager[None]:
+        """Context manager which collects worksheet writes issued by create,
+        update and clear inside the ``with`` block and sends them to Google API
+        on exit, using one values.batchClear and one values.batchUpdate call per
+        spreadsheet. Available only when using Service Account.
+
+        For example:
+
+            with conn.batch():
+                conn.update(worksheet="Example 1", data=df)
+                conn.update(worksheet="Example 2", data=df)
+
+        Note that inside the ``with`` block clear returns an empty dict, as the
+        Google API response is not known until the batch is sent.
+        """
+        return self.client.batch()
+
     def set_default(
         self,
         spreadsheet: str,
@@ -720,10 +2111,4 @@ class GSheetsConnection(ExperimentalBaseConnection[GSheetsClient], GSheetsClient
         else:
             name = ""
             cfg = ""
-        return f"""
-        ---
-        **st.connection {name}built from `{module_name}.{class_name}`**
-        {cfg}
-        - Learn more using `st.help()`
-        ---
-        """
+        return _REPR_HTML_TEMPLATE.format(name=name, module_name=module_name, class_name=class_name, cfg=cfg)
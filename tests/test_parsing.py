@@ -0,0 +1,84 @@
+from io import BytesIO
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from streamlit_gsheets.gsheets_connection import _parse_csv, _read_csv_arrow
+
+BIRTHS = b"date,births,name\n1/1/1975,265775,x\n2/1/1975,241045,y\n3/1/1975,268849,z\n"
+
+
+@pytest.mark.parametrize(
+    ("content", "options"),
+    [
+        (BIRTHS, {}),
+        (b"name,flag\nw,True\nx,TRUE\ny,true\nz,False\n", {}),
+        (b"name,flag\nw,false\nx,FALSE\ny,False\nz,true\n", {}),
+        (b"a,b,c\n1,NA,x\n2,null,N/A\n#N/A,x,\n", {}),
+        (b"a,b\n,1\n,2\n", {}),
+        (BIRTHS, {"dtype": {"births": "int64"}}),
+        (BIRTHS, {"dtype": {"births": "float32", "name": str}}),
+        (BIRTHS, {"dtype": {"births": object}}),
+        (b"a,b\n1,x\n2,\n", {"dtype": {"b": str}}),
+        (b"a,b\n1,x\n,y\n", {"dtype": {"a": object, "b": "object"}}),
+        (BIRTHS, {"usecols": ["name", "date"]}),
+        (BIRTHS, {"usecols": [2, 0]}),
+        (b"a,b\n2020-01-01,12:30:00\n2020-01-02,13:00:00\n", {}),
+    ],
+)
+def test_read_csv_arrow_matches_read_csv(content: bytes, options: dict):
+    df = _read_csv_arrow(content, **options)
+
+    assert df is not None
+    assert_frame_equal(df, pd.read_csv(BytesIO(content), **options))
+
+
+@pytest.mark.parametrize(
+    ("content", "options"),
+    [
+        (b"a,a\n1,2\n", {}),
+        (b"a,\n1,2\n", {}),
+        (b"a,b\n", {}),
+        (b"a\n+1\n", {}),
+        (b"a\n0x1A\n", {}),
+        (b"a\n0X1A\n", {}),
+        (b"a\n9999999999999999999\n1\n", {}),
+        (b"a\n-12345678901234567890\n", {}),
+        (b"a,b\nTrue,1\n,2\n", {}),
+        (b"a\nTrue\nNA\n", {}),
+        (b"a,b\n1,x\n,y\n", {"dtype": {"a": "int64"}}),
+        (BIRTHS, {"dtype": {"date": "datetime64[ns]"}}),
+        (BIRTHS, {"usecols": ["missing"]}),
+        (BIRTHS, {"dtype": {"births": "int64"}, "dtype_backend": "pyarrow"}),
+        (BIRTHS, {"dtype_backend": "numpy_nullable"}),
+    ],
+)
+def test_read_csv_arrow_leaves_mismatches_to_read_csv(content: bytes, options: dict):
+    assert _read_csv_arrow(content, **options) is None
+
+
+@pytest.mark.parametrize(
+    ("content", "options"),
+    [
+        (b"a,a\n1,2\n", {}),
+        (b"a\n+1\n0x1A\n", {}),
+        (b"a\nTrue\nNA\n", {}),
+        (b"a;b\n1;2\n", {"sep": ";"}),
+        (BIRTHS, {"dtype": {"births": "int64"}}),
+    ],
+)
+def test_parse_csv_matches_read_csv(content: bytes, options: dict):
+    assert_frame_equal(_parse_csv(content, **options), pd.read_csv(BytesIO(content), **options))
+
+
+def test_parse_csv_concatenates_chunks():
+    assert_frame_equal(_parse_csv(BIRTHS, chunksize=2), pd.read_csv(BytesIO(BIRTHS)))
+
+
+def test_read_csv_arrow_with_pyarrow_dtype_backend():
+    df = _read_csv_arrow(BIRTHS, dtype_backend="pyarrow")
+
+    assert df is not None
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert df["births"].tolist() == [265775, 241045, 268849]
@@ -1,11 +1,13 @@
-from unittest.mock import mock_open, patch
+from io import BytesIO
+from unittest.mock import MagicMock, mock_open, patch
 
 import pandas as pd
 import pytest
 import streamlit as st
-from pandas.testing import assert_frame_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 
-from streamlit_gsheets import GSheetsConnection
+from streamlit_gsheets import GSheetsConnection, gsheets_connection
+from streamlit_gsheets.gsheets_connection import GSheetsPublicSpreadsheetClient
 
 
 @pytest.fixture()
@@ -18,41 +20,50 @@ def expected_df() -> pd.DataFrame:
     )
 
 
-def test_read_public_sheet(expected_df: pd.DataFrame):
-    url = "https://docs.google.com/spreadsheets/d/1JDy9md2VZPz4JbYtRPJLs81_3jUK47nx6GYQjgU8qNY/edit"
+@pytest.fixture(scope="session")
+def public_conn() -> GSheetsConnection:
+    return st.connection("connection_name", type=GSheetsConnection)
 
-    conn = st.connection("connection_name", type=GSheetsConnection)
 
-    df = conn.read(spreadsheet=url, usecols=[0, 1])
+def test_read_public_sheet(public_conn: GSheetsConnection, expected_df: pd.DataFrame):
+    url = "https://docs.google.com/spreadsheets/d/1JDy9md2VZPz4JbYtRPJLs81_3jUK47nx6GYQjgU8qNY/edit"
 
-    assert_frame_equal(df.head(), expected_df)
+    df = public_conn.read(spreadsheet=url, usecols=[0, 1])
 
+    assert_series_equal(df["births"].head().reset_index(drop=True), expected_df["births"], check_names=False)
+    assert df["date"].head().tolist() == expected_df["date"].tolist()
 
-def test_query_public_sheet():
+
+def test_read_public_sheet_pyarrow_backend(public_conn: GSheetsConnection, expected_df: pd.DataFrame):
     url = "https://docs.google.com/spreadsheets/d/1JDy9md2VZPz4JbYtRPJLs81_3jUK47nx6GYQjgU8qNY/edit"
 
-    conn = st.connection("connection_name", type=GSheetsConnection)
+    df = public_conn.read(spreadsheet=url, usecols=[0, 1], dtype_backend="pyarrow")
+
+    assert all(isinstance(column_dtype, pd.ArrowDtype) for column_dtype in df.dtypes)
+    assert df.head().to_dict("list") == expected_df.to_dict("list")
 
-    df = conn.query("select date from my_table where births = 265775", spreadsheet=url)
+
+def test_query_public_sheet(public_conn: GSheetsConnection):
+    url = "https://docs.google.com/spreadsheets/d/1JDy9md2VZPz4JbYtRPJLs81_3jUK47nx6GYQjgU8qNY/edit"
+
+    df = public_conn.query("select date from my_table where births = 265775", spreadsheet=url)
 
     assert len(df) == 1
-    assert df["date"].values[0] == "1/1/1975"
+    assert df["date"].iloc[0] == "1/1/1975"
 
 
-def test_query_worksheet_public_sheet():
+def test_query_worksheet_public_sheet(public_conn: GSheetsConnection):
     url = "https://docs.google.com/spreadsheets/d/1JDy9md2VZPz4JbYtRPJLs81_3jUK47nx6GYQjgU8qNY/edit"
     worksheet = 1585633377  # Example 2, note that this is the gid, not the worksheet name
 
-    conn = st.connection("connection_name", type=GSheetsConnection)
-
-    df = conn.query(
+    df = public_conn.query(
         "select date from my_table where births = 1000000",
         spreadsheet=url,
         worksheet=worksheet,
     )
 
     assert len(df) == 1
-    assert df["date"].values[0] == "1/1/1975"
+    assert df["date"].iloc[0] == "1/1/1975"
 
 
 secrets_contents = """
@@ -75,3 +86,99 @@ def test_no_secrets_contents():
 
     with pytest.raises(ValueError, match="Spreadsheet must be specified"):
         conn.read()
+
+
+# CSV exports, whose query results used to differ from pandas.read_csv
+query_exports = {
+    "late_string_in_numbers": ("a,b\n" + "1,x\n" * 30000 + "abc,y\n").encode(),
+    "semicolons": b"name\na;b\nc;d\n",
+    "tabs": b"name\na\tb\nc\td\n",
+    "na_strings": b"a,b\n1,N/A\n2,3\n",
+    "t_and_f": b"a,b\nt,1\nf,2\n",
+    "integers_with_blanks": b"a,b\n1,x\n,y\n3,z\n",
+}
+
+
+@pytest.mark.parametrize("name", query_exports)
+def test_query_matches_read_csv(name: str):
+    content = query_exports[name]
+    client = GSheetsPublicSpreadsheetClient({})
+
+    with patch("streamlit_gsheets.gsheets_connection._fetch_csv", return_value=content):
+        df = client.query("select * from my_table", spreadsheet=f"query-{name}")
+
+    assert_frame_equal(df, pd.read_csv(BytesIO(content)))
+
+
+def test_query_without_tables_downloads_nothing():
+    client = GSheetsPublicSpreadsheetClient({})
+
+    with patch("streamlit_gsheets.gsheets_connection._fetch_csv") as fetch_csv:
+        df = client.query("select 1 as one", spreadsheet="query-without-tables")
+
+    fetch_csv.assert_not_called()
+    assert df["one"].tolist() == [1]
+
+
+@pytest.fixture()
+def http_session():
+    session = MagicMock()
+    response = session.get.return_value.__enter__.return_value
+    response.status_code = 200
+    response.headers = {}
+    response.iter_content.return_value = [b"a\n1\n"]
+    gsheets_connection._CSV_EXPORTS.clear()
+    with patch.object(gsheets_connection, "_http_session", return_value=session):
+        yield session
+    gsheets_connection._CSV_EXPORTS.clear()
+
+
+@pytest.mark.usefixtures("http_session")
+def test_csv_exports_expire_after_two_ttls():
+    now = 1_000_000.0
+    with patch.object(gsheets_connection.time, "time", return_value=now):
+        gsheets_connection._fetch_csv("https://export/1", max_age=10)
+    with patch.object(gsheets_connection.time, "time", return_value=now + 19):
+        gsheets_connection._fetch_csv("https://export/2", max_age=10)
+        assert "https://export/1" in gsheets_connection._CSV_EXPORTS
+    with patch.object(gsheets_connection.time, "time", return_value=now + 21):
+        gsheets_connection._fetch_csv("https://export/2", max_age=10)
+        assert "https://export/1" not in gsheets_connection._CSV_EXPORTS
+
+
+@pytest.mark.usefixtures("http_session")
+def test_csv_exports_are_bounded_by_bytes():
+    with patch.object(gsheets_connection, "_CSV_EXPORTS_MAX_BYTES", 10):
+        for position in range(3):
+            gsheets_connection._fetch_csv(f"https://export/{position}", max_age=None)
+
+    assert list(gsheets_connection._CSV_EXPORTS) == ["https://export/1", "https://export/2"]
+
+
+EXPORT = "https://docs.google.com/spreadsheet/ccc?key=KEY&output=csv"
+
+
+@pytest.mark.parametrize(
+    ("spreadsheet", "worksheet", "expected"),
+    [
+        ("https://docs.google.com/spreadsheets/d/KEY/edit", None, EXPORT),
+        ("https://docs.google.com/spreadsheets/d/KEY/edit#gid=12", None, f"{EXPORT}&gid=12"),
+        ("https://docs.google.com/spreadsheets/d/KEY/edit?gid=1#gid=2", None, f"{EXPORT}&gid=2"),
+        ("https://docs.google.com/spreadsheets/d/KEY/edit?usp=sharing&gid=5", None, f"{EXPORT}&gid=5"),
+        ("https://docs.google.com/spreadsheets/d/KEY/edit?gid=5&gid=6", None, f"{EXPORT}&gid=5"),
+        ("https://docs.google.com/spreadsheets/d/KEY/edit?gid=", None, EXPORT),
+        ("https://docs.google.com/spreadsheets/d/KEY/edit?gid=&gid=7", None, f"{EXPORT}&gid=7"),
+        ("https://docs.google.com/spreadsheets/d/KEY/edit#gid=12", 34, f"{EXPORT}&gid=34"),
+        ("KEY", None, EXPORT),
+        ("KEY", "34", f"{EXPORT}&gid=34"),
+        (
+            "https://docs.google.com/spreadsheets/d/KEY",
+            None,
+            "https://docs.google.com/spreadsheet/ccc?key=https://docs.google.com/spreadsheets/d/KEY&output=csv",
+        ),
+    ],
+)
+def test_get_download_as_csv_url(spreadsheet: str, worksheet, expected: str):
+    client = GSheetsPublicSpreadsheetClient({})
+
+    assert client._get_download_as_csv_url(spreadsheet=spreadsheet, worksheet=worksheet) == expected
@@ -0,0 +1,280 @@
+import json
+import re
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import streamlit as st
+from gspread.spreadsheet import Spreadsheet
+from gspread.utils import a1_to_rowcol
+from gspread.worksheet import Worksheet
+from gspread_dataframe import get_as_dataframe, set_with_dataframe
+from pandas.testing import assert_frame_equal
+
+from streamlit_gsheets.gsheets_connection import GSheetsServiceAccountClient, _to_dataframe, _values_to_dataframe
+
+
+def mock_worksheet(spreadsheet: MagicMock, title: str) -> MagicMock:
+    worksheet = MagicMock(spec=Worksheet)
+    worksheet.title = title
+    worksheet.row_count = 1000
+    worksheet.col_count = 26
+    worksheet.spreadsheet = spreadsheet
+    return worksheet
+
+
+@pytest.fixture()
+def client() -> GSheetsServiceAccountClient:
+    # without service account secrets no gspread client is created, worksheets are passed as handles
+    return GSheetsServiceAccountClient({})
+
+
+def test_batch_sends_one_clear_and_one_update_per_spreadsheet(client: GSheetsServiceAccountClient):
+    spreadsheet = MagicMock(spec=Spreadsheet)
+    spreadsheet.id = "spreadsheet-id"
+    sheet1 = mock_worksheet(spreadsheet, "Sheet1")
+    sheet2 = mock_worksheet(spreadsheet, "Sheet2")
+    df = pd.DataFrame({"a": [1, 2]})
+
+    with client.batch():
+        client.update(worksheet=sheet1, data=df)
+        client.update(worksheet=sheet2, data=df)
+
+    spreadsheet.values_batch_clear.assert_called_once_with(body={"ranges": ["'Sheet1'", "'Sheet2'"]})
+    spreadsheet.values_batch_update.assert_called_once()
+    data = spreadsheet.values_batch_update.call_args.kwargs["body"]["data"]
+    assert [value_range["range"] for value_range in data] == ["'Sheet1'!A1", "'Sheet2'!A1"]
+    spreadsheet.values_update.assert_not_called()
+    sheet1.clear.assert_not_called()
+
+
+def test_batch_clear_discards_updates_queued_before(client: GSheetsServiceAccountClient):
+    spreadsheet = MagicMock(spec=Spreadsheet)
+    spreadsheet.id = "spreadsheet-id"
+    sheet1 = mock_worksheet(spreadsheet, "Sheet1")
+
+    with client.batch():
+        client.update(worksheet=sheet1, data=pd.DataFrame({"a": [1]}))
+        client.clear(worksheet=sheet1)
+
+    spreadsheet.values_batch_clear.assert_called_once_with(body={"ranges": ["'Sheet1'", "'Sheet1'"]})
+    spreadsheet.values_batch_update.assert_not_called()
+
+
+VALUES: List[list] = [
+    ["a", "", "c", ""],
+    [1, "", "x"],
+    [],
+    [2, "", "y", ""],
+]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"drop_empty_rows": False},
+        {"drop_empty_columns": False},
+        {"drop_empty_rows": False, "drop_empty_columns": False},
+        {"header": None},
+        {"nrows": 2},
+        {"index_col": 0},
+    ],
+)
+def test_values_to_dataframe_matches_get_as_dataframe(options: dict):
+    spreadsheet = MagicMock(spec=Spreadsheet)
+    spreadsheet.values_get.return_value = {"values": VALUES}
+    worksheet = mock_worksheet(spreadsheet, "Sheet1")
+    worksheet.row_count, worksheet.col_count = 10, 6
+
+    expected = get_as_dataframe(worksheet, evaluate_formulas=True, **options)
+
+    assert_frame_equal(_values_to_dataframe(VALUES, (10, 6), **options), expected)
+
+
+def mock_columns_batch_get(grid: List[list]):
+    """Answers values.batchGet of header row and single columns like Sheets API, with majorDimension
+    COLUMNS and trailing empty cells left out."""
+
+    def trimmed(cells: list) -> list:
+        while cells and cells[-1] == "":
+            cells = cells[:-1]
+        return cells
+
+    def request(method: str, url: str, params: dict):  # noqa: ARG001
+        value_ranges = []
+        for range_name in params["ranges"]:
+            cells = range_name.rsplit("!", 1)[1]
+            if cells == "1:1":
+                value_ranges.append({"values": [[cell] if cell != "" else [] for cell in trimmed(grid[0])]})
+                continue
+            match = re.fullmatch(r"([A-Z]+)1:\1(\d*)", cells)
+            assert match is not None
+            column = a1_to_rowcol(f"{match[1]}1")[1] - 1
+            last_row = int(match[2]) if match[2] else len(grid)
+            values = trimmed([row[column] if column < len(row) else "" for row in grid[:last_row]])
+            value_ranges.append({"values": [values]} if values else {})
+        response = MagicMock()
+        response.content = json.dumps({"valueRanges": value_ranges}).encode()
+        return response
+
+    return request
+
+
+@pytest.mark.parametrize(
+    ("grid", "options"),
+    [
+        ([["a", "b"], [2, "x"], ["", "y"], [8, "z"], ["", "w"]], {"usecols": [0]}),
+        ([["a", "b"], [2, "x"], ["", "y"], [8, "z"], ["", "w"]], {"usecols": [0], "drop_empty_rows": False}),
+        ([["a", "b"], [2, "x"], [3, "y"]], {"usecols": [0]}),
+        ([["a", "b"], [1, ""], ["", ""], [3, "q"]], {"usecols": [1], "drop_empty_rows": False}),
+        ([["a", "a", "c"], [1, 2, 3]], {"usecols": [1, 2]}),
+        ([["", "b", ""], [1, "x", 5], [2, "y", 6]], {"usecols": [0, 2]}),
+        ([["a", "", "c"], [1, "", 3], ["", "", ""], [4, "", 6]], {"usecols": [1, 2], "nrows": 2}),
+        ([["a", "b", "c"], [1, "x", ""], [2, "y", ""]], {"usecols": [1, 2], "index_col": 0}),
+    ],
+)
+def test_read_of_selected_columns_matches_get_as_dataframe(client: GSheetsServiceAccountClient, grid, options: dict):
+    spreadsheet = MagicMock(spec=Spreadsheet)
+    spreadsheet.id = "columns-spreadsheet-id"
+    spreadsheet.values_get.return_value = {"values": grid}
+    spreadsheet.client = MagicMock()
+    spreadsheet.client.request.side_effect = mock_columns_batch_get(grid)
+    worksheet = mock_worksheet(spreadsheet, "Sheet1")
+    worksheet.row_count, worksheet.col_count = 8, 4
+
+    expected = get_as_dataframe(worksheet, evaluate_formulas=True, **options)
+
+    assert_frame_equal(client._worksheet_to_dataframe(worksheet, True, **options), expected)
+    assert spreadsheet.client.request.call_count == 1
+
+
+def test_query_sees_same_dataframe_as_read(client: GSheetsServiceAccountClient):
+    spreadsheet = MagicMock(spec=Spreadsheet)
+    spreadsheet.id = "query-spreadsheet-id"
+    spreadsheet.values_get.return_value = {"values": VALUES}
+    spreadsheet.client = MagicMock()
+    spreadsheet.client.request.return_value.content = json.dumps({"valueRanges": [{"values": VALUES}]}).encode()
+    spreadsheet.client.request.return_value.json.return_value = {"valueRanges": [{"values": VALUES}]}
+    worksheet = mock_worksheet(spreadsheet, "Sheet1")
+    spreadsheet.worksheet.return_value = worksheet
+    spreadsheet.worksheets.return_value = [worksheet]
+    client._spreadsheet_cache[("query-spreadsheet", None)] = spreadsheet
+
+    df = client.read(spreadsheet="query-spreadsheet", worksheet="Sheet1")
+    result = client.query('select * from "Sheet1"', spreadsheet="query-spreadsheet")
+
+    assert list(result.columns) == list(df.columns) == ["a", "c"]
+    assert_frame_equal(result, df.reset_index(drop=True), check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (np.arange(3), {"value": [0, 1, 2]}),
+        (np.arange(4).reshape(2, 2), {0: [0, 2], 1: [1, 3]}),
+        (np.array([(1, "x"), (2, "y")], dtype=[("a", "i8"), ("b", "U1")]), {"a": [1, 2], "b": ["x", "y"]}),
+        ([[1, "x"], [2, "y"]], {0: [1, 2], 1: ["x", "y"]}),
+        ([{"a": 1}, {"a": 2}], {"a": [1, 2]}),
+    ],
+)
+def test_to_dataframe(data, expected: dict):
+    df = _to_dataframe(data)
+
+    assert df is not None
+    assert df.to_dict("list") == expected
+
+
+def mock_spreadsheet(client: GSheetsServiceAccountClient, name: str, titles: List[str]) -> MagicMock:
+    spreadsheet = MagicMock(spec=Spreadsheet)
+    spreadsheet.id = f"{name}-id"
+    spreadsheet.values_get.return_value = {"values": VALUES}
+    worksheets = {title: mock_worksheet(spreadsheet, title) for title in titles}
+    spreadsheet.worksheet.side_effect = worksheets.__getitem__
+    client._spreadsheet_cache[(name, None)] = spreadsheet
+    return spreadsheet
+
+
+def test_read_with_and_without_max_cache_mb_share_cache(client: GSheetsServiceAccountClient):
+    st.cache_resource.clear()
+    spreadsheet = mock_spreadsheet(client, "budget-spreadsheet", ["Sheet1", "Sheet2"])
+
+    for _ in range(5):
+        client.read(spreadsheet="budget-spreadsheet", worksheet="Sheet1", max_cache_mb=50)
+        client.read(spreadsheet="budget-spreadsheet", worksheet="Sheet2")
+
+    assert spreadsheet.values_get.call_count == 2
+
+
+def test_read_clears_oldest_dataframes_beyond_max_cache_mb(client: GSheetsServiceAccountClient):
+    st.cache_resource.clear()
+    spreadsheet = mock_spreadsheet(client, "small-budget-spreadsheet", ["Sheet1", "Sheet2"])
+    read_options: Dict[str, Any] = {"spreadsheet": "small-budget-spreadsheet", "max_cache_mb": 0.0001}
+
+    client.read(worksheet="Sheet1", **read_options)
+    client.read(worksheet="Sheet2", **read_options)
+    client.read(worksheet="Sheet2", **read_options)
+    assert spreadsheet.values_get.call_count == 2
+
+    client.read(worksheet="Sheet1", **read_options)
+    assert spreadsheet.values_get.call_count == 3
+
+
+@pytest.mark.parametrize("method", ["query", "query_arrow"])
+def test_query_closes_cursor_when_registration_fails(client: GSheetsServiceAccountClient, method: str):
+    st.cache_resource.clear()
+    cursor = MagicMock()
+
+    failing = patch.object(client, "_register_worksheets", side_effect=KeyError("Sheet3"))
+    with patch.object(client, "_duckdb_cursor", return_value=cursor), failing, pytest.raises(KeyError):
+        getattr(client, method)('select * from "Sheet3"', spreadsheet="failing-spreadsheet")
+
+    cursor.close.assert_called_once_with()
+
+
+WRITTEN_DATAFRAMES = [
+    pd.DataFrame({"code": ["'007", "x", None], "n": [1, 2, 3]}),
+    pd.DataFrame({"'id": [1.5, float("nan")]}),
+    pd.DataFrame(
+        [[1, "'a", "c"], [2, "b", ""]],
+        columns=pd.MultiIndex.from_tuples([("x", "a"), ("x", "b"), ("y", "'c")]),
+    ),
+]
+
+
+def set_with_dataframe_values(df: pd.DataFrame) -> List[list]:
+    worksheet = mock_worksheet(MagicMock(spec=Spreadsheet), "Sheet1")
+    set_with_dataframe(worksheet, df)
+    cells = worksheet.update_cells.call_args.args[0]
+    values = [[""] * max(cell.col for cell in cells) for _ in range(max(cell.row for cell in cells))]
+    for cell in cells:
+        values[cell.row - 1][cell.col - 1] = cell.value
+    return values
+
+
+@pytest.mark.parametrize("df", WRITTEN_DATAFRAMES)
+def test_update_writes_same_values_as_set_with_dataframe(client: GSheetsServiceAccountClient, df: pd.DataFrame):
+    spreadsheet = MagicMock(spec=Spreadsheet)
+    worksheet = mock_worksheet(spreadsheet, "Sheet1")
+
+    client.update(spreadsheet=spreadsheet, worksheet=worksheet, data=df)
+
+    assert spreadsheet.values_update.call_args.kwargs["body"]["values"] == set_with_dataframe_values(df)
+
+
+@pytest.mark.parametrize("df", WRITTEN_DATAFRAMES)
+def test_create_writes_same_values_as_set_with_dataframe(df: pd.DataFrame):
+    client = GSheetsServiceAccountClient({"spreadsheet": "write-spreadsheet"})
+    spreadsheet = MagicMock(spec=Spreadsheet)
+    worksheet = mock_worksheet(spreadsheet, "Sheet1")
+    worksheet.row_count, worksheet.col_count = len(df) + df.columns.nlevels, df.shape[1]
+    spreadsheet.add_worksheet.return_value = worksheet
+    client._spreadsheet_cache[("write-spreadsheet", None)] = spreadsheet
+
+    client.create(worksheet="Sheet1", data=df)
+
+    spreadsheet.add_worksheet.assert_called_once_with(title="Sheet1", rows=len(df) + df.columns.nlevels, cols=df.shape[1])
+    worksheet.resize.assert_not_called()
+    assert spreadsheet.values_update.call_args.kwargs["body"]["values"] == set_with_dataframe_values(df)